@@ -24,6 +24,26 @@ class TennisCourtClient:
          - Controls application flow
     """
     
+    # Design Decision: Dispatch table built once at class level
+    # Why? - O(1) lookup instead of walking an if-elif chain
+    #      - Adding a command = one line here + one handler method
+    # Values are method names, resolved with getattr() on the instance
+    _COMMAND_HANDLERS = {
+        "help": "handle_help",
+        "exit": "handle_exit",
+        "quit": "handle_exit",
+        "login": "handle_login",
+        "show_list": "handle_show_list",
+        "show_day": "handle_show_day",
+        "show_my_res": "handle_show_my_res",
+        "make_res": "handle_make_res",
+        "cancel_res": "handle_cancel_res",
+        "batch": "handle_batch",
+    }
+    
+    # Commands that work without logging in
+    _NO_LOGIN_COMMANDS = frozenset({"help", "exit", "quit", "login"})
+    
     def __init__(self, host: str, port: int):
         """
         Initialize client.
@@ -36,16 +56,23 @@ class TennisCourtClient:
         self.session = SessionManager()
         self.running = True
         
-        # Enhanced welcome banner
-        print("\n" + "=" * 70)
-        print("║" + " " * 68 + "║")
-        print("║" + "    🎾  TENNIS COURT RESERVATION SYSTEM  🎾    ".center(68) + "║")
-        print("║" + " " * 68 + "║")
-        print("=" * 70)
-        DisplayFormatter.success(f"Connected to server at {host}:{port}")
-        DisplayFormatter.warning("Type 'help' to see available commands")
-        DisplayFormatter.info("Login required before making reservations")
-        print("=" * 70 + "\n")
+        # Connect in the background while the banner prints and the user types
+        self.http_client.warm_up()
+        
+        # Enhanced welcome banner (assembled first, written once)
+        fmt = DisplayFormatter
+        banner = (
+            "\n" + "=" * 70 + "\n"
+            + "║" + " " * 68 + "║\n"
+            + "║" + "    🎾  TENNIS COURT RESERVATION SYSTEM  🎾    ".center(68) + "║\n"
+            + "║" + " " * 68 + "║\n"
+            + "=" * 70 + "\n"
+            + f"{fmt.SUCCESS_PREFIX}Connected to server at {host}:{port}{fmt.LINE_END}"
+            + f"{fmt.WARNING_PREFIX}Type 'help' to see available commands{fmt.LINE_END}"
+            + f"{fmt.INFO_PREFIX}Login required before making reservations{fmt.LINE_END}"
+            + "=" * 70 + "\n\n"
+        )
+        sys.stdout.write(banner)
     
     def run(self):
         """
@@ -94,6 +121,8 @@ class TennisCourtClient:
             except Exception as e:
                 DisplayFormatter.error(f"Unexpected error: {e}")
         
+        # Tell the server we're done instead of leaving the socket to time out
+        self.http_client.close()
         print("\nGoodbye!")
     
     def execute_command(self, cmd):
@@ -106,49 +135,32 @@ class TennisCourtClient:
              - Clear control flow
         
         Teaching Point: Dictionary dispatch vs if-elif
-        Alternative: command_map = {"login": self.handle_login, ...}
-        Current: if-elif chain
-        Why current? - More explicit, easier to follow for learning
+        Current: command_map (_COMMAND_HANDLERS) = one dict lookup
+        Alternative: if-elif chain - explicit, but one string compare
+        per command tried before reaching the right branch
         """
-        
-        # Commands that don't require login
-        if cmd.name == "help":
-            DisplayFormatter.print_help()
-            return
-        
-        elif cmd.name == "exit" or cmd.name == "quit":
-            self.running = False
-            return
-        
-        elif cmd.name == "login":
-            self.handle_login(cmd)
+        handler_name = self._COMMAND_HANDLERS.get(cmd.name)
+        if handler_name is None:
+            DisplayFormatter.error(f"Unknown command: {cmd.name}")
+            DisplayFormatter.info("Type 'help' for available commands")
             return
         
         # Commands that require login
-        if not self.session.require_login():
+        if cmd.name not in self._NO_LOGIN_COMMANDS and not self.session.require_login():
             return
         
-        if cmd.name == "show_list":
-            self.handle_show_list(cmd)
-        
-        elif cmd.name == "show_day":
-            self.handle_show_day(cmd)
-        
-        elif cmd.name == "show_my_res":
-            self.handle_show_my_res(cmd)
-        
-        elif cmd.name == "make_res":
-            self.handle_make_res(cmd)
-        
-        elif cmd.name == "cancel_res":
-            self.handle_cancel_res(cmd)
-        
-        else:
-            DisplayFormatter.error(f"Unknown command: {cmd.name}")
-            DisplayFormatter.info("Type 'help' for available commands")
+        getattr(self, handler_name)(cmd)
     
     # ========== Command Handlers ==========
     
+    def handle_help(self, cmd):
+        """Handle help command."""
+        DisplayFormatter.print_help()
+    
+    def handle_exit(self, cmd):
+        """Handle exit/quit command."""
+        self.running = False
+    
     def handle_login(self, cmd):
         """Handle login command."""
         valid, params = CommandParser.validate_login(cmd)
@@ -257,6 +269,103 @@ class TennisCourtClient:
             DisplayFormatter.success(message)
         else:
             DisplayFormatter.error(message)
+    
+    def handle_batch(self, cmd):
+        """
+        Handle chained commands ("make_res MON 14; show_my_res").
+        
+        Design Decision: Send all commands in one POST /batch request
+        Why? - One round trip instead of one per command
+             - Server runs them in order, like typing them one by one
+        """
+        ops = []
+        for sub in cmd.args:
+            op = self.build_batch_op(sub)
+            if op is None:
+                DisplayFormatter.error(f"Can't chain command: {self.command_text(sub)}")
+                DisplayFormatter.info(
+                    "Chain only show_list, show_day, show_my_res, make_res, cancel_res"
+                )
+                return
+            ops.append(op)
+        
+        token = self.session.get_token()
+        if not token:
+            return
+        
+        success, message, results = self.http_client.batch(token, ops)
+        
+        if not success or results is None:
+            DisplayFormatter.error(message)
+            return
+        
+        for sub, result in zip(cmd.args, results):
+            DisplayFormatter.info(f"> {self.command_text(sub)}")
+            self.show_batch_result(sub, result)
+    
+    @staticmethod
+    def build_batch_op(cmd):
+        """
+        Translate one validated command into a batch operation dict.
+        
+        Returns:
+            {"method", "path", "body"} dict, or None if the command is
+            invalid or can't be chained (help, login, exit, ...)
+        """
+        if cmd.name == "show_list":
+            return {"method": "GET", "path": "/schedule"}
+            
+        elif cmd.name == "show_day":
+            valid, day = CommandParser.validate_show_day(cmd)
+            if valid and day:
+                return {"method": "GET", "path": f"/schedule/day?day={day}"}
+            
+        elif cmd.name == "show_my_res":
+            return {"method": "GET", "path": "/reservations"}
+            
+        elif cmd.name == "make_res":
+            valid, params = CommandParser.validate_make_res(cmd)
+            if valid and params:
+                day, hour = params
+                return {
+                    "method": "POST",
+                    "path": "/reservations",
+                    "body": {"day": day, "hour": hour}
+                }
+            
+        elif cmd.name == "cancel_res":
+            valid, day = CommandParser.validate_cancel_res(cmd)
+            if valid and day:
+                return {"method": "DELETE", "path": f"/reservations/{day}"}
+        
+        return None
+    
+    @staticmethod
+    def show_batch_result(cmd, result):
+        """Display one batch result like the single-command handler would."""
+        body = result.get('body', {})
+        message = body.get('message', '')
+        data = body.get('data', {})
+        
+        if not body.get('success'):
+            DisplayFormatter.error(message)
+            
+        elif cmd.name == "show_list":
+            DisplayFormatter.format_weekly_schedule(data.get('schedule', {}))
+            
+        elif cmd.name == "show_day":
+            DisplayFormatter.format_day_schedule(data.get('day', ''), data.get('schedule', []))
+            
+        elif cmd.name == "show_my_res":
+            DisplayFormatter.format_reservations(data.get('reservations', []))
+            
+        else:
+            DisplayFormatter.success(message)
+    
+    @staticmethod
+    def command_text(cmd) -> str:
+        """Rebuild the command line as the user typed it."""
+        return " ".join([cmd.name] + cmd.args)
 
 
 def main():
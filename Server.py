@@ -12,14 +12,38 @@ Teaching Point: This is where networking happens!
 We're using raw TCP sockets (not HTTP library)
 """
 
+import queue
+import re
 import socket
 import threading
+import time
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from server.auth_manager import AuthenticationManager
 from server.reservation_manager import ReservationManager
 from server.schedule_store import ScheduleStore
-from server.http_handler import HTTPHandler, HTTPRequest
+from server.http_handler import HTTPHandler, HTTPRequest, PrebuiltResponse, RequestTooLarge
 import json
+from typing import Dict, Optional
+
+
+# Design Decision: Render the static error responses once, at import time
+# Why? - Sent on every unauthenticated or malformed request
+#      - Nothing in them depends on the request
+_ERR_NO_TOKEN = PrebuiltResponse(HTTPHandler.build_response(
+    401, message="Missing authentication token. Please login first."))
+_ERR_BAD_TOKEN = PrebuiltResponse(HTTPHandler.build_response(
+    401, message="Invalid or expired token. Please login again."))
+_ERR_MALFORMED = PrebuiltResponse(HTTPHandler.build_response(
+    400, message="Malformed HTTP request"))
+_ERR_TOO_LARGE = PrebuiltResponse(HTTPHandler.build_response(
+    413, message="Request too large"))
+_ERR_INTERNAL = PrebuiltResponse(HTTPHandler.build_response(
+    500, message="Internal server error"))
+
+# Whitespace or control characters are never valid in a method or path
+# (POST /batch ops carry both as JSON strings, so check them here)
+_UNSAFE_TARGET_RE = re.compile(r'[\s\x00-\x1f\x7f]')
 
 
 class TennisCourtServer:
@@ -32,6 +56,34 @@ class TennisCourtServer:
          - Controls socket lifecycle
     """
     
+    # Seconds an idle keep-alive connection stays open
+    KEEP_ALIVE_TIMEOUT = 15
+    
+    # Maximum number of connections served concurrently
+    MAX_WORKERS = 32
+    
+    # Seconds spent discarding unread request bytes before closing
+    DRAIN_TIMEOUT = 1.0
+    
+    # Maximum number of operations in one POST /batch request
+    MAX_BATCH_OPS = 32
+    
+    # Seconds between background writes of the schedule file
+    FLUSH_INTERVAL = 0.2
+    
+    # Routes: (method, path) -> (handler method name, requires login)
+    # Handlers that require login are also passed the username
+    _ROUTES = {
+        ("POST", "/login"): ("handle_login", False),
+        ("POST", "/reset"): ("handle_reset", False),
+        ("GET", "/schedule"): ("handle_get_weekly_schedule", True),
+        ("GET", "/schedule/day"): ("handle_get_day_schedule", True),
+        ("GET", "/reservations"): ("handle_get_my_reservations", True),
+        ("POST", "/reservations"): ("handle_make_reservation", True),
+        ("DELETE", "/reservations"): ("handle_cancel_reservation", True),
+        ("POST", "/batch"): ("handle_batch", True),
+    }
+    
     def __init__(self, host: str, port: int):
         """
         Initialize server components.
@@ -48,6 +100,13 @@ class TennisCourtServer:
         self.host = host
         self.port = port
         self.socket = None
+        self.pool = None
+        
+        # Open client sockets (served or queued), so stop() can close them
+        self._clients = set()
+        # Sockets whose worker is waiting for the next request, oldest first
+        self._idle: Dict[socket.socket, None] = {}
+        self._clients_lock = threading.Lock()
         
         # Initialize all components
         # Design Decision: Create components here (composition pattern)
@@ -58,6 +117,24 @@ class TennisCourtServer:
         self.auth_manager = AuthenticationManager()
         self.reservation_manager = ReservationManager(self.store)
         
+        # Background writer for the schedule file
+        # Design Decision: Write-behind (handlers only mark the store dirty)
+        # Why? - Handlers never block on disk I/O
+        #      - Bursts of reservations collapse into one write
+        self._shutdown = threading.Event()
+        self._flusher_thread = threading.Thread(target=self._flusher, daemon=True)
+        self._flusher_thread.start()
+        
+        # Single writer thread for schedule changes (see _write)
+        self._ops = queue.SimpleQueue()
+        self._writer_thread = threading.Thread(target=self._writer, daemon=True)
+        self._writer_thread.start()
+        
+        # Serialized GET /schedule and /schedule/day bodies (see _cached_response)
+        self._response_cache: Dict[str, bytes] = {}
+        self._cache_version = 0
+        self._cache_lock = threading.Lock()
+        
         print(f"[Server] Initialized on {host}:{port}")
     
     def start(self):
@@ -69,7 +146,7 @@ class TennisCourtServer:
         2. Bind to address
         3. Listen for connections
         4. Accept clients in loop
-        5. Handle each client in separate thread
+        5. Hand each client to a worker thread from the pool
         """
         try:
             # Create TCP socket
@@ -98,6 +175,17 @@ class TennisCourtServer:
             print(f"[Server] Listening on {self.host}:{self.port}")
             print("[Server] Press Ctrl+C to stop")
             
+            # Worker pool for client connections
+            # Design Decision: Bounded thread pool (not one thread per client)
+            # Why? - Handle multiple clients concurrently
+            #      - Fixed number of threads, no thread creation per connection
+            #      - Memory stays bounded under load
+            # Alternative: selectors event loop (more complex)
+            self.pool = ThreadPoolExecutor(
+                max_workers=self.MAX_WORKERS,
+                thread_name_prefix="client"
+            )
+            
             # Main accept loop
             while True:
                 # Accept incoming connection
@@ -105,17 +193,12 @@ class TennisCourtServer:
                 client_socket, client_address = self.socket.accept()
                 print(f"[Server] New connection from {client_address}")
                 
-                # Handle client in separate thread
-                # Design Decision: Multi-threaded (one thread per client)
-                # Why? - Handle multiple clients concurrently
-                #      - Don't block while processing one client
-                # Alternative: async/await (more complex)
-                client_thread = threading.Thread(
-                    target=self.handle_client,
-                    args=(client_socket, client_address),
-                    daemon=True  # Thread dies when main program exits
-                )
-                client_thread.start()
+                with self._clients_lock:
+                    self._clients.add(client_socket)
+                
+                # Queued until a worker is free - make room if all are idle
+                self.pool.submit(self.handle_client, client_socket, client_address)
+                self._evict_idle()
                 
         except KeyboardInterrupt:
             print("\n[Server] Shutting down...")
@@ -129,6 +212,146 @@ class TennisCourtServer:
         if self.socket:
             self.socket.close()
             print("[Server] Socket closed")
+        
+        # Wake up workers blocked on idle keep-alive connections
+        with self._clients_lock:
+            for client_socket in self._clients:
+                try:
+                    client_socket.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+        
+        if self.pool:
+            # cancel_futures (Python 3.9+) drops connections still queued
+            self.pool.shutdown(wait=True, cancel_futures=True)
+            self.pool = None
+        
+        # Those never reached handle_client, so close their sockets here
+        with self._clients_lock:
+            for client_socket in self._clients:
+                client_socket.close()
+            self._clients.clear()
+            self._idle.clear()
+        
+        # No handlers are left, so no more writes can be queued
+        self._ops.put(None)
+        self._writer_thread.join(timeout=5)
+        
+        # Drain pending schedule changes to disk
+        self._shutdown.set()
+        self._flusher_thread.join(timeout=5)
+    
+    def _flusher(self):
+        """
+        Periodically write the schedule to disk if it changed.
+        
+        Runs in a daemon thread until stop() sets the shutdown event,
+        then does one final flush so no change is lost.
+        """
+        while not self._shutdown.wait(self.FLUSH_INTERVAL):
+            self.store.flush()
+        self.store.flush()
+    
+    def _writer(self):
+        """
+        Apply queued schedule changes, one at a time, in order.
+        
+        Runs in a daemon thread until stop() queues None.
+        """
+        while True:
+            op = self._ops.get()
+            if op is None:
+                return
+            
+            func, args, future = op
+            try:
+                future.set_result(func(*args))
+            except Exception as e:
+                future.set_exception(e)
+    
+    def _write(self, func, *args):
+        """
+        Run a schedule-changing call on the writer thread and wait for it.
+        
+        Design Decision: Single writer thread owns all schedule changes
+        Why? - Worker threads never compete for the write path
+             - Changes are applied strictly in arrival order
+             - Reads don't go through the queue (cache or direct call)
+        
+        Teaching Point: This is the "actor" pattern
+        Instead of sharing the data and locking it, one thread owns
+        the changes and everyone else sends it messages (the queue).
+        A Future carries the result back to the waiting handler.
+        """
+        future = Future()
+        self._ops.put((func, args, future))
+        return future.result()
+    
+    def _evict_idle(self):
+        """
+        Close the oldest idle keep-alive connection if others are queued.
+        
+        Design Decision: Evict idle connections only under pressure
+        Why? - Each keep-alive connection holds a worker while it waits
+             - MAX_WORKERS idle clients would otherwise lock everyone
+               else out for up to KEEP_ALIVE_TIMEOUT seconds
+             - The client reconnects on its next command (stale retry)
+        
+        Called after each accept and whenever a worker goes idle.
+        """
+        with self._clients_lock:
+            if len(self._clients) <= self.MAX_WORKERS or not self._idle:
+                return  # Nobody is waiting for a worker
+            idle_socket = next(iter(self._idle))
+            del self._idle[idle_socket]
+        
+        # Wakes its worker with EOF, which then closes the connection
+        try:
+            idle_socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass  # Already closed by its worker
+    
+    def _reject(self, client_socket: socket.socket, response: PrebuiltResponse):
+        """
+        Send an error response and close, without losing it to a reset.
+        
+        Teaching Point: Closing a socket with unread received data makes
+        the OS send RST instead of FIN, and the peer may then drop our
+        response before reading it. So after sending we shut down our
+        side and discard whatever the client still sends (bounded by
+        DRAIN_TIMEOUT) before handle_client closes the socket.
+        """
+        deadline = time.monotonic() + self.DRAIN_TIMEOUT
+        try:
+            response.set_connection_close().send(client_socket)
+            client_socket.shutdown(socket.SHUT_WR)
+            while True:
+                left = deadline - time.monotonic()
+                if left <= 0:
+                    break
+                client_socket.settimeout(left)
+                if not client_socket.recv(65536):
+                    break  # Client closed its side too
+        except OSError:
+            pass  # Timed out or reset - close anyway
+    
+    @staticmethod
+    def _tune_socket(sock: socket.socket):
+        """
+        Set TCP options for small request/response traffic.
+        
+        TCP_NODELAY: Send small responses immediately
+        Why? - Nagle's algorithm holds back small writes while waiting
+               for an ACK, and delayed ACKs can add ~40ms per response
+             - Every response here is well under one packet
+        
+        SO_KEEPALIVE: Let the OS detect peers that vanished
+        """
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        except OSError:
+            pass  # Tuning only - the connection still works without it
     
     def handle_client(self, client_socket: socket.socket, client_address):
         """
@@ -138,51 +361,88 @@ class TennisCourtServer:
             client_socket: Socket connected to client
             client_address: Client's (host, port) tuple
         
-        Teaching Point: This runs in a separate thread for each client!
+        Teaching Point: This runs in a worker thread from the pool!
         Multiple clients can be handled simultaneously.
+        
+        Design Decision: Persistent connections (HTTP/1.1 keep-alive)
+        Why? - Client sends one request per REPL command
+             - Reusing the socket saves a TCP handshake per command
+             - Idle connections are closed after KEEP_ALIVE_TIMEOUT seconds,
+               or sooner when other clients are waiting (see _evict_idle)
         """
+        # Idle timeout: how long we wait for the next request on this socket
+        client_socket.settimeout(self.KEEP_ALIVE_TIMEOUT)
+        self._tune_socket(client_socket)
+        
+        # Buffered reader lets us read line-by-line (headers) and then
+        # exactly Content-Length bytes (body), one request at a time
+        rfile = client_socket.makefile('rb')
+        
         try:
-            # Receive data from client
-            # Buffer size: 4096 bytes (4 KB)
-            # Design Decision: 4KB is usually enough for HTTP headers + small body
-            # Why? - HTTP requests are typically small
-            #      - Can receive in chunks if needed
-            data = client_socket.recv(4096)
-            
-            if not data:
-                return  # Client closed connection
-            
-            # Parse HTTP request
-            request = HTTPHandler.parse_request(data)
-            
-            if request is None:
-                # Malformed request
-                response = HTTPHandler.build_response(
-                    400,
-                    message="Malformed HTTP request"
-                )
-                client_socket.sendall(response.to_bytes())
-                return
-            
-            print(f"[Server] {client_address}: {request.method} {request.path}")
-            
-            # Route request to appropriate handler
-            response = self.route_request(request)
-            
-            # Send response
-            client_socket.sendall(response.to_bytes())
+            while True:
+                # Idle (evictable) only until the next request starts:
+                # peek() returns as soon as the first bytes arrive, so a
+                # client part-way through a request is never evicted
+                with self._clients_lock:
+                    self._idle[client_socket] = None
+                self._evict_idle()
+                try:
+                    rfile.peek(1)
+                finally:
+                    with self._clients_lock:
+                        self._idle.pop(client_socket, None)
+                
+                try:
+                    data = HTTPHandler.read_request(rfile)
+                except RequestTooLarge as e:
+                    # Rest of the request is never read, so close afterwards
+                    print(f"[Server] {client_address}: {e}")
+                    self._reject(client_socket, _ERR_TOO_LARGE)
+                    return
+                
+                if data == b"":
+                    return  # Client closed connection
+                
+                # Parse HTTP request (None = bad Content-Length)
+                request = HTTPHandler.parse_request(data) if data is not None else None
+                
+                if request is None:
+                    # Malformed request - we can't trust the stream anymore
+                    self._reject(client_socket, _ERR_MALFORMED)
+                    return
+                
+                print(f"[Server] {client_address}: {request.method} {request.path}")
+                
+                # Route request to appropriate handler
+                response = self.route_request(request)
+                
+                # Honor "Connection: close" from the client
+                keep_alive = request.headers.get('connection', '').lower() != 'close'
+                if not keep_alive:
+                    response = response.set_connection_close()
+                
+                # Send response
+                response.send(client_socket)
+                HTTPHandler.release_request(request)
+                
+                if not keep_alive:
+                    return
             
+        except socket.timeout:
+            # Idle keep-alive connection - just close it
+            print(f"[Server] Closing idle connection {client_address}")
         except Exception as e:
             print(f"[Server] Error handling client {client_address}: {e}")
             try:
-                error_response = HTTPHandler.build_response(
-                    500,
-                    message="Internal server error"
-                )
-                client_socket.sendall(error_response.to_bytes())
+                # The socket is closed below, so say so in the response
+                _ERR_INTERNAL.set_connection_close().send(client_socket)
             except:
                 pass  # Can't even send error response
         finally:
+            with self._clients_lock:
+                self._clients.discard(client_socket)
+                self._idle.pop(client_socket, None)
+            rfile.close()
             client_socket.close()
     
     def route_request(self, request: HTTPRequest):
@@ -194,68 +454,104 @@ class TennisCourtServer:
              - No third-party libraries allowed
              - Simple enough for this application
         
+        Design Decision: (method, path) dispatch table
+        Why? - One dict lookup instead of an if-elif chain of compares
+             - Routes and their auth requirement are listed in one place
+        
         Routes:
           POST   /login              -> login()
+          POST   /reset              -> reset() (dev only)
           GET    /schedule           -> get_weekly_schedule()
           GET    /schedule/day       -> get_day_schedule()
           GET    /reservations       -> get_my_reservations()
           POST   /reservations       -> make_reservation()
           DELETE /reservations       -> cancel_reservation()
+          POST   /batch              -> several of the above in one request
         """
         
-        # Login (no auth required)
-        if request.method == "POST" and request.path == "/login":
-            return self.handle_login(request)
+        route = self._ROUTES.get((request.method, request.path))
         
-        # Reset endpoint for testing (no auth required - only use in dev!)
-        if request.method == "POST" and request.path == "/reset":
-            self.reservation_manager.reset_weekly_schedule()
-            self.auth_manager.clear_all_sessions()
-            return HTTPHandler.build_response(
-                200,
-                message="Server reset: all reservations and sessions cleared"
-            )
+        # DELETE also accepts /reservations/<DAY>: parse the day once here
+        if route is None and request.method == "DELETE" and request.path.startswith("/reservations/"):
+            request.query_params.setdefault('day', request.path[len("/reservations/"):])
+            route = self._ROUTES[("DELETE", "/reservations")]
+        
+        # Unknown endpoints still need a valid token before we say 404
+        handler_name, requires_auth = route if route is not None else (None, True)
+        
+        if not requires_auth:
+            return getattr(self, handler_name)(request)
         
         # All other endpoints require authentication
         token = HTTPHandler.extract_token(request)
         if not token:
-            return HTTPHandler.build_response(
-                401,
-                message="Missing authentication token. Please login first."
-            )
+            return _ERR_NO_TOKEN
         
         username = self.auth_manager.validate_token(token)
         if not username:
+            return _ERR_BAD_TOKEN
+        
+        if handler_name is None:
+            # Unknown endpoint
             return HTTPHandler.build_response(
-                401,
-                message="Invalid or expired token. Please login again."
+                404,
+                message=f"Endpoint not found: {request.method} {request.path}"
             )
         
-        # Route authenticated requests
-        if request.method == "GET" and request.path == "/schedule":
-            return self.handle_get_weekly_schedule(request, username)
+        return getattr(self, handler_name)(request, username)
+    
+    # ========== Response Cache ==========
+    
+    def _cached_response(self, key: str, build):
+        """
+        Serve a schedule GET from the response cache.
         
-        elif request.method == "GET" and request.path == "/schedule/day":
-            return self.handle_get_day_schedule(request, username)
+        Args:
+            key: Cache key (the request path)
+            build: Function that builds the response on a cache miss
         
-        elif request.method == "GET" and request.path == "/reservations":
-            return self.handle_get_my_reservations(request, username)
+        Design Decision: Cache the serialized JSON body, not the data
+        Why? - Schedule reads are far more common than changes
+             - A hit skips both the schedule walk and json.dumps
         
-        elif request.method == "POST" and request.path == "/reservations":
-            return self.handle_make_reservation(request, username)
+        Teaching Point: The version counter prevents caching stale data
+        If the schedule changes while we build, the version moves on
+        and the (possibly outdated) body is simply not stored.
+        """
+        with self._cache_lock:
+            body = self._response_cache.get(key)
+            version = self._cache_version
         
-        elif request.method == "DELETE" and request.path.startswith("/reservations"):
-            return self.handle_cancel_reservation(request, username)
+        if body is not None:
+            return HTTPHandler.build_response_raw(200, body)
         
-        else:
-            # Unknown endpoint
-            return HTTPHandler.build_response(
-                404,
-                message=f"Endpoint not found: {request.method} {request.path}"
-            )
+        response = build()
+        
+        if response.status_code == 200:
+            with self._cache_lock:
+                if version == self._cache_version:
+                    self._response_cache[key] = response.body
+        
+        return response
+    
+    def _invalidate_cache(self):
+        """Drop cached schedule responses (call after every schedule change)."""
+        with self._cache_lock:
+            self._cache_version += 1
+            self._response_cache.clear()
     
     # ========== Endpoint Handlers ==========
     
+    def handle_reset(self, request: HTTPRequest):
+        """Handle POST /reset (testing only - no auth required, only use in dev!)"""
+        self._write(self.reservation_manager.reset_weekly_schedule)
+        self._invalidate_cache()
+        self.auth_manager.clear_all_sessions()
+        return HTTPHandler.build_response(
+            200,
+            message="Server reset: all reservations and sessions cleared"
+        )
+    
     def handle_login(self, request: HTTPRequest):
         """Handle POST /login"""
         body = HTTPHandler.parse_json_body(request)
@@ -285,12 +581,15 @@ class TennisCourtServer:
     
     def handle_get_weekly_schedule(self, request: HTTPRequest, username: str):
         """Handle GET /schedule"""
-        schedule = self.reservation_manager.get_weekly_schedule()
-        return HTTPHandler.build_response(
-            200,
-            data={"schedule": schedule},
-            message="Weekly schedule retrieved"
-        )
+        def build():
+            schedule = self.reservation_manager.get_weekly_schedule()
+            return HTTPHandler.build_response(
+                200,
+                data={"schedule": schedule},
+                message="Weekly schedule retrieved"
+            )
+        
+        return self._cached_response("/schedule", build)
     
     def handle_get_day_schedule(self, request: HTTPRequest, username: str):
         """Handle GET /schedule/day?day=MON"""
@@ -302,19 +601,22 @@ class TennisCourtServer:
                 message="Missing 'day' query parameter"
             )
         
-        success, result = self.reservation_manager.get_day_schedule(day)
+        def build():
+            success, result = self.reservation_manager.get_day_schedule(day)
+            
+            if success:
+                return HTTPHandler.build_response(
+                    200,
+                    data={"day": day, "schedule": result},
+                    message=f"Schedule for {day} retrieved"
+                )
+            else:
+                return HTTPHandler.build_response(
+                    400,
+                    message=result  # Error message
+                )
         
-        if success:
-            return HTTPHandler.build_response(
-                200,
-                data={"day": day, "schedule": result},
-                message=f"Schedule for {day} retrieved"
-            )
-        else:
-            return HTTPHandler.build_response(
-                400,
-                message=result  # Error message
-            )
+        return self._cached_response(f"/schedule/day?day={day}", build)
     
     def handle_get_my_reservations(self, request: HTTPRequest, username: str):
         """Handle GET /reservations"""
@@ -348,11 +650,12 @@ class TennisCourtServer:
                 message="Invalid hour format. Must be an integer (9-22)"
             )
         
-        success, message = self.reservation_manager.make_reservation(
-            username, day, hour
+        success, message = self._write(
+            self.reservation_manager.make_reservation, username, day, hour
         )
         
         if success:
+            self._invalidate_cache()
             return HTTPHandler.build_response(200, message=message)
         else:
             # Determine appropriate status code
@@ -367,16 +670,8 @@ class TennisCourtServer:
     
     def handle_cancel_reservation(self, request: HTTPRequest, username: str):
         """Handle DELETE /reservations?day=MON or DELETE /reservations/MON"""
-        # Support both query param and path param
-        day = request.query_params.get('day', '')
-        
-        if not day:
-            # Try to extract from path: /reservations/MON
-            parts = request.path.split('/')
-            if len(parts) >= 3:
-                day = parts[2]
-        
-        day = day.upper()
+        # route_request puts a /reservations/MON path param here as well
+        day = request.query_params.get('day', '').upper()
         
         if not day:
             return HTTPHandler.build_response(
@@ -384,11 +679,12 @@ class TennisCourtServer:
                 message="Missing 'day' parameter"
             )
         
-        success, message = self.reservation_manager.cancel_reservation(
-            username, day
+        success, message = self._write(
+            self.reservation_manager.cancel_reservation, username, day
         )
         
         if success:
+            self._invalidate_cache()
             return HTTPHandler.build_response(200, message=message)
         else:
             # Check if it's invalid day (validation error) vs no reservation found
@@ -396,6 +692,114 @@ class TennisCourtServer:
                 return HTTPHandler.build_response(400, message=message)
             else:
                 return HTTPHandler.build_response(404, message=message)
+    
+    def handle_batch(self, request: HTTPRequest, username: str):
+        """
+        Handle POST /batch
+        
+        Body format:
+          {
+            "ops": [{"method": "POST", "path": "/reservations",
+                     "body": {"day": "MON", "hour": 14}}, ...],
+            "stop_on_error": false
+          }
+        
+        Design Decision: Run each op through route_request in-process
+        Why? - N commands cost one round trip instead of N
+             - Each op gets exactly the same auth and validation
+               as if it had been sent on its own
+        
+        Response data: {"results": [{"status": 200, "body": {...}}, ...]}
+        With stop_on_error, execution stops after the first non-2xx op.
+        """
+        body = HTTPHandler.parse_json_body(request)
+        ops = body.get('ops') if isinstance(body, dict) else None
+        
+        if not isinstance(ops, list) or not ops:
+            return HTTPHandler.build_response(
+                400,
+                message="Missing 'ops' list in request body"
+            )
+        
+        if len(ops) > self.MAX_BATCH_OPS:
+            return HTTPHandler.build_response(
+                400,
+                message=f"Too many operations in batch (max {self.MAX_BATCH_OPS})"
+            )
+        
+        stop_on_error = bool(body.get('stop_on_error', False))
+        results = []
+        
+        for op in ops:
+            sub_request = self._build_batch_request(request, op)
+            
+            if sub_request is None:
+                response = HTTPHandler.build_response(
+                    400,
+                    message="Invalid batch operation"
+                )
+            else:
+                try:
+                    if sub_request.path in ("/batch", "/login", "/reset"):
+                        # Only plain API calls - no nesting, no session changes
+                        response = HTTPHandler.build_response(
+                            400,
+                            message=f"Operation not allowed in batch: {sub_request.path}"
+                        )
+                    else:
+                        response = self.route_request(sub_request)
+                finally:
+                    HTTPHandler.release_request(sub_request)
+            
+            results.append({
+                "status": response.status_code,
+                "body": json.loads(response.body)
+            })
+            
+            if stop_on_error and not 200 <= response.status_code < 300:
+                break
+        
+        return HTTPHandler.build_response(
+            200,
+            data={"results": results},
+            message=f"Executed {len(results)} of {len(ops)} operation(s)"
+        )
+    
+    @staticmethod
+    def _build_batch_request(request: HTTPRequest, op) -> Optional[HTTPRequest]:
+        """
+        Turn one batch op into a regular HTTPRequest.
+        
+        Design Decision: Fill in an HTTPRequest directly (no HTTP text)
+        Why? - Method and path are never pasted into a header block, so
+               a "\r\n" in them can't inject headers or drop Authorization
+             - Path/query split by the same helper as parse_request
+             - Authorization header and token are copied from the batch request
+        
+        Returns None if the op is not a dict with a clean method and path.
+        """
+        if not isinstance(op, dict):
+            return None
+        
+        method = op.get('method')
+        path = op.get('path')
+        if not isinstance(method, str) or not isinstance(path, str):
+            return None
+        if not method or not path or _UNSAFE_TARGET_RE.search(method + path):
+            return None
+        
+        sub_request = HTTPHandler.acquire_request()
+        sub_request.method = method.upper()
+        HTTPHandler.set_target(sub_request, path)
+        
+        auth_header = request.headers.get('authorization')
+        if auth_header is not None:
+            sub_request.headers['authorization'] = auth_header
+        sub_request.token = request.token
+        
+        if op.get('body') is not None:
+            sub_request.body = memoryview(json.dumps(op['body']).encode('utf-8'))
+        return sub_request
 
 
 def main():
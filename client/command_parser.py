@@ -7,7 +7,35 @@ Why? - Commands have simple structure
      - Easy to understand and debug
 """
 
-from typing import Optional, Tuple, List
+from typing import Any, Optional, Tuple, List
+
+
+# Design Decision: Module-level frozensets for validation
+# Why? - Built once at import, not on every command
+#      - O(1) hash lookup instead of scanning a list
+_VALID_COMMANDS = frozenset((
+    'help', 'exit', 'quit', 'login', 'show_list',
+    'show_day', 'show_my_res', 'make_res', 'cancel_res'
+))
+
+_VALID_DAYS = frozenset(('MON', 'TUE', 'WED', 'THU', 'FRI', 'SAT', 'SUN'))
+
+# Basic range check only (server will do full validation)
+_VALID_HOURS = frozenset(range(0, 24))
+
+# Number of arguments each command takes
+# The last argument keeps any spaces (e.g. a password with spaces)
+# Commands not listed here take no arguments
+_ARITY = {
+    'login': 2,
+    'show_day': 1,
+    'make_res': 2,
+    'cancel_res': 1,
+}
+
+# Commands that take the whole line, ';' included (the server rejects
+# POST /login inside a batch anyway)
+_UNCHAINED_COMMANDS = frozenset(('login',))
 
 
 class Command:
@@ -18,9 +46,11 @@ class Command:
     Why? - Clear structure
          - Type hints
          - Easy to pass around
+    
+    For the "batch" command, args holds the chained Command objects.
     """
     
-    def __init__(self, name: str, args: List[str]):
+    def __init__(self, name: str, args: List[Any]):
         self.name = name
         self.args = args
     
@@ -56,34 +86,65 @@ class CommandParser:
         
         Examples:
             "login user1 1" -> Command("login", ["user1", "1"])
+            "login user1 my pass" -> Command("login", ["user1", "my pass"])
             "show_list" -> Command("show_list", [])
             "make_res WED 14" -> Command("make_res", ["WED", "14"])
+            "make_res MON 14; show_my_res" -> Command("batch", [...])
+            "login user1 pa;ss" -> Command("login", ["user1", "pa;ss"])
         """
-        # Strip and check for empty
-        user_input = user_input.strip()
+        # Check for empty (caller has already stripped the line)
         if not user_input:
             return None
         
-        # Split by whitespace
-        parts = user_input.split()
+        # Split off the command name first
+        # Design Decision: Validate the name before splitting the rest
+        # Why? - Unknown commands are rejected without more work
+        parts = user_input.split(None, 1)
         
         if not parts:
             return None
         
         command_name = parts[0].lower()
-        args = parts[1:]
         
-        # Validate that it's a known command
-        valid_commands = [
-            'help', 'exit', 'quit', 'login', 'show_list', 
-            'show_day', 'show_my_res', 'make_res', 'cancel_res'
-        ]
+        # Chained commands are sent to the server in one request
+        # login is never chained, so its password may contain ';'
+        if ';' in user_input and command_name not in _UNCHAINED_COMMANDS:
+            return CommandParser.parse_batch(user_input)
         
-        if command_name not in valid_commands:
+        # Validate that it's a known command
+        if command_name not in _VALID_COMMANDS:
             return None
         
+        # Split arguments, at most _ARITY pieces (-1 = no limit)
+        rest = parts[1] if len(parts) > 1 else ""
+        args = rest.split(None, _ARITY.get(command_name, 0) - 1) if rest else []
+        
         return Command(command_name, args)
     
+    @staticmethod
+    def parse_batch(user_input: str) -> Optional[Command]:
+        """
+        Parse ';'-separated commands into a single "batch" Command.
+        
+        Returns:
+            Command("batch", [Command, ...]), the lone Command if only
+            one part is non-empty, or None if any part is invalid
+        
+        Design Decision: Reject the whole line if one part is invalid
+        Why? - Nothing is sent half-way through a typo
+        """
+        parts = [part.strip() for part in user_input.split(';')]
+        parts = [part for part in parts if part]
+        commands = [CommandParser.parse(part) for part in parts]
+        
+        if not commands or any(cmd is None for cmd in commands):
+            return None
+        
+        if len(commands) == 1:
+            return commands[0]
+        
+        return Command("batch", commands)
+    
     @staticmethod
     def validate_login(cmd: Command) -> Tuple[bool, Optional[Tuple[str, str]]]:
         """
@@ -116,8 +177,7 @@ class CommandParser:
         
         day = cmd.args[0].upper()
         
-        valid_days = ['MON', 'TUE', 'WED', 'THU', 'FRI', 'SAT', 'SUN']
-        if day not in valid_days:
+        if day not in _VALID_DAYS:
             return False, None
         
         return True, day
@@ -139,17 +199,17 @@ class CommandParser:
         
         day = cmd.args[0].upper()
         
-        valid_days = ['MON', 'TUE', 'WED', 'THU', 'FRI', 'SAT', 'SUN']
-        if day not in valid_days:
+        if day not in _VALID_DAYS:
             return False, None
         
-        try:
-            hour = int(cmd.args[1])
-        except ValueError:
+        # Digits only - no exception path for input like "nine"
+        if not cmd.args[1].isdecimal():
             return False, None
         
+        hour = int(cmd.args[1])
+        
         # Basic range check (server will do full validation)
-        if not (0 <= hour <= 23):
+        if hour not in _VALID_HOURS:
             return False, None
         
         return True, (day, hour)
@@ -167,8 +227,7 @@ class CommandParser:
         
         day = cmd.args[0].upper()
         
-        valid_days = ['MON', 'TUE', 'WED', 'THU', 'FRI', 'SAT', 'SUN']
-        if day not in valid_days:
+        if day not in _VALID_DAYS:
             return False, None
         
         return True, day
@@ -7,7 +7,8 @@ Why? - Easy to change display format
      - Clean separation of concerns
 """
 
-from typing import List, Dict, Any
+import sys
+from typing import List, Dict, Any, Optional
 
 
 class DisplayFormatter:
@@ -31,33 +32,70 @@ class DisplayFormatter:
         'bold': '\033[1m'
     }
     
+    # Design Decision: Status-line prefixes assembled once, at class creation
+    # Why? - success/error/info/warning run for almost every command
+    #      - Each call is then one string build + one write
+    SUCCESS_PREFIX = COLORS['green'] + "✓ "
+    ERROR_PREFIX = COLORS['red'] + "✗ "
+    INFO_PREFIX = COLORS['blue'] + "ℹ "
+    WARNING_PREFIX = COLORS['yellow'] + "⚠ "
+    LINE_END = COLORS['reset'] + "\n"
+    
+    # Weekly table cells never change, so build them once
+    # Available - 9 chars, need 12 total (3 spaces padding)
+    # Reserved - 8 chars, need 12 total (4 spaces padding)
+    # No data - centered
+    _CELL_AVAILABLE = f" {COLORS['green']}Available{COLORS['reset']}  │"
+    _CELL_RESERVED = f"  {COLORS['red']}Reserved{COLORS['reset']}  │"
+    _CELL_NO_DATA = "    ---     │"
+    _TIME_CELLS = {hour: f"│ {hour:02d}:00 │" for hour in range(9, 23)}
+    
+    # Static table headers (title + borders), joined once at class creation
+    _WEEKLY_HEADER = "\n".join([
+        f"\n{COLORS['bold']}{'='*100}{COLORS['reset']}",
+        f"{COLORS['bold']}{'WEEKLY SCHEDULE':^100}{COLORS['reset']}",
+        f"{COLORS['bold']}{'='*100}{COLORS['reset']}\n",
+        # Top border - 7 days * 12 chars + time column 7 + borders
+        "┌───────┬────────────┬────────────┬────────────┬────────────┬────────────┬────────────┬────────────┐",
+        "│ Time  │    MON     │    TUE     │    WED     │    THU     │    FRI     │    SAT     │    SUN     │",
+        "├───────┼────────────┼────────────┼────────────┼────────────┼────────────┼────────────┼────────────┤",
+    ])
+    _RESERVATIONS_HEADER = "\n".join([
+        f"\n{COLORS['bold']}{'='*50}{COLORS['reset']}",
+        f"{COLORS['bold']}{'YOUR RESERVATIONS':^50}{COLORS['reset']}",
+        f"{COLORS['bold']}{'='*50}{COLORS['reset']}\n",
+        "┌──────────┬────────────────────────┐",
+        "│   Day    │      Time Slot         │",
+        "├──────────┼────────────────────────┤",
+    ])
+    
+    _help_text: Optional[str] = None  # Built by print_help on first use
+    
+    # Design Decision: Prefixes bound as default arguments
+    # Why? - Resolved once when the method is defined, so each call
+    #        skips the class attribute lookups
+    #      - Callers never pass them
+    #      - sys.stdout is still looked up per call (redirection works)
+    
     @staticmethod
-    def success(message: str):
+    def success(message: str, _prefix=SUCCESS_PREFIX, _end=LINE_END):
         """Print success message in green."""
-        color = DisplayFormatter.COLORS['green']
-        reset = DisplayFormatter.COLORS['reset']
-        print(f"{color}✓ {message}{reset}")
+        sys.stdout.write(f"{_prefix}{message}{_end}")
     
     @staticmethod
-    def error(message: str):
+    def error(message: str, _prefix=ERROR_PREFIX, _end=LINE_END):
         """Print error message in red."""
-        color = DisplayFormatter.COLORS['red']
-        reset = DisplayFormatter.COLORS['reset']
-        print(f"{color}✗ {message}{reset}")
+        sys.stdout.write(f"{_prefix}{message}{_end}")
     
     @staticmethod
-    def info(message: str):
+    def info(message: str, _prefix=INFO_PREFIX, _end=LINE_END):
         """Print info message in blue."""
-        color = DisplayFormatter.COLORS['blue']
-        reset = DisplayFormatter.COLORS['reset']
-        print(f"{color}ℹ {message}{reset}")
+        sys.stdout.write(f"{_prefix}{message}{_end}")
     
     @staticmethod
-    def warning(message: str):
+    def warning(message: str, _prefix=WARNING_PREFIX, _end=LINE_END):
         """Print warning message in yellow."""
-        color = DisplayFormatter.COLORS['yellow']
-        reset = DisplayFormatter.COLORS['reset']
-        print(f"{color}⚠ {message}{reset}")
+        sys.stdout.write(f"{_prefix}{message}{_end}")
     
     @staticmethod
     def format_weekly_schedule(schedule: Dict[str, List[Dict]]):
@@ -77,50 +115,36 @@ class DisplayFormatter:
         days = ['MON', 'TUE', 'WED', 'THU', 'FRI', 'SAT', 'SUN']
         hours = list(range(9, 23))  # 9 to 22
         
-        bold = DisplayFormatter.COLORS['bold']
-        green = DisplayFormatter.COLORS['green']
-        red = DisplayFormatter.COLORS['red']
-        reset = DisplayFormatter.COLORS['reset']
-        
-        # Header
-        print(f"\n{bold}{'='*100}{reset}")
-        print(f"{bold}{'WEEKLY SCHEDULE':^100}{reset}")
-        print(f"{bold}{'='*100}{reset}\n")
+        out: List[str] = []  # Collected lines, written once at the end
         
-        # Top border - 7 days * 12 chars + time column 7 + borders
-        print("┌───────┬────────────┬────────────┬────────────┬────────────┬────────────┬────────────┬────────────┐")
+        # Title, top border, header row and separator (prebuilt)
+        out.append(DisplayFormatter._WEEKLY_HEADER)
         
-        # Header row
-        print(f"│ Time  │    MON     │    TUE     │    WED     │    THU     │    FRI     │    SAT     │    SUN     │")
+        # Print each hour row (cells are prebuilt, see _CELL_*)
+        available = DisplayFormatter._CELL_AVAILABLE
+        reserved = DisplayFormatter._CELL_RESERVED
+        no_data = DisplayFormatter._CELL_NO_DATA
         
-        # Separator after header
-        print("├───────┼────────────┼────────────┼────────────┼────────────┼────────────┼────────────┼────────────┤")
+        # Resolve each day's slots to their cell strings once: {hour: cell}
+        # Then every row is one str.join over a list comprehension
+        columns = [
+            {
+                int(s['hour']): available if s['available'] else reserved
+                for s in schedule.get(day, [])
+            }
+            for day in days
+        ]
         
-        # Print each hour row
         for hour in hours:
-            time_str = f"{hour:02d}:00"
-            cells = [f" {time_str:<5} │"]
-            
-            for day in days:
-                # Find slot for this day and hour
-                day_schedule = schedule.get(day, [])
-                slot = next((s for s in day_schedule if int(s['hour']) == hour), None)
-                
-                if slot and slot['available']:
-                    # Available - 9 chars, need 12 total (3 spaces padding)
-                    cells.append(f" {green}Available{reset}  │")
-                elif slot and not slot['available']:
-                    # Reserved - 8 chars, need 12 total (4 spaces padding)
-                    cells.append(f"  {red}Reserved{reset}  │")
-                else:
-                    # No data - centered
-                    cells.append(f"    ---     │")
-            
-            print("│" + "".join(cells))
+            out.append(DisplayFormatter._TIME_CELLS[hour] + "".join(
+                [column.get(hour, no_data) for column in columns]
+            ))
         
         # Bottom border
-        print("└───────┴────────────┴────────────┴────────────┴────────────┴────────────┴────────────┴────────────┘")
-        print()
+        out.append("└───────┴────────────┴────────────┴────────────┴────────────┴────────────┴────────────┴────────────┘")
+        out.append("")
+        
+        sys.stdout.write("\n".join(out) + "\n")
     
     @staticmethod
     def format_day_schedule(day: str, schedule: List[Dict]):
@@ -142,13 +166,15 @@ class DisplayFormatter:
         cyan = DisplayFormatter.COLORS['cyan']
         reset = DisplayFormatter.COLORS['reset']
         
-        print(f"\n{bold}{'='*50}{reset}")
-        print(f"{bold}{f'SCHEDULE FOR {day}':^50}{reset}")
-        print(f"{bold}{'='*50}{reset}\n")
+        out: List[str] = []  # Collected lines, written once at the end
+        
+        out.append(f"\n{bold}{'='*50}{reset}")
+        out.append(f"{bold}{f'SCHEDULE FOR {day}':^50}{reset}")
+        out.append(f"{bold}{'='*50}{reset}\n")
         
-        print("┌────────────────┬──────────────────┐")
-        print("│  Time Slot     │      Status      │")
-        print("├────────────────┼──────────────────┤")
+        out.append("┌────────────────┬──────────────────┐")
+        out.append("│  Time Slot     │      Status      │")
+        out.append("├────────────────┼──────────────────┤")
         
         for slot in schedule:
             time_slot = slot['time_slot']
@@ -159,10 +185,12 @@ class DisplayFormatter:
                 status = f"{red}✗ Reserved{reset}"
             
             # Center-align for better readability
-            print(f"│ {cyan}{time_slot:^14}{reset} │ {status:^16} │")
+            out.append(f"│ {cyan}{time_slot:^14}{reset} │ {status:^16} │")
         
-        print("└────────────────┴──────────────────┘")
-        print()
+        out.append("└────────────────┴──────────────────┘")
+        out.append("")
+        
+        sys.stdout.write("\n".join(out) + "\n")
     
     @staticmethod
     def format_reservations(reservations: List[Dict]):
@@ -186,34 +214,47 @@ class DisplayFormatter:
             DisplayFormatter.info("You have no reservations.")
             return
         
-        print(f"\n{bold}{'='*50}{reset}")
-        print(f"{bold}{'YOUR RESERVATIONS':^50}{reset}")
-        print(f"{bold}{'='*50}{reset}\n")
+        out: List[str] = []  # Collected lines, written once at the end
         
-        print("┌──────────┬────────────────────────┐")
-        print("│   Day    │      Time Slot         │")
-        print("├──────────┼────────────────────────┤")
+        out.append(DisplayFormatter._RESERVATIONS_HEADER)
         
         for res in reservations:
             day = res['day']
             time_slot = res['time_slot']
-            print(f"│ {cyan}{day:^8}{reset} │ {green}{time_slot:^22}{reset} │")
+            out.append(f"│ {cyan}{day:^8}{reset} │ {green}{time_slot:^22}{reset} │")
+        
+        out.append("└──────────┴────────────────────────┘")
+        out.append(f"\n{bold}Total: {len(reservations)} reservation(s){reset}\n")
         
-        print("└──────────┴────────────────────────┘")
-        print(f"\n{bold}Total: {len(reservations)} reservation(s){reset}\n")
+        sys.stdout.write("\n".join(out) + "\n")
     
     @staticmethod
     def print_help():
-        """Print available commands with enhanced formatting."""
+        """
+        Print available commands with enhanced formatting.
+        
+        Design Decision: Build the help text once, on first use
+        Why? - It only depends on constants
+             - Later calls are a single write of the cached string
+        """
+        if DisplayFormatter._help_text is None:
+            DisplayFormatter._help_text = DisplayFormatter._build_help_text()
+        sys.stdout.write(DisplayFormatter._help_text)
+    
+    @staticmethod
+    def _build_help_text() -> str:
+        """Assemble the full help screen (see print_help)."""
         bold = DisplayFormatter.COLORS['bold']
         cyan = DisplayFormatter.COLORS['cyan']
         green = DisplayFormatter.COLORS['green']
         yellow = DisplayFormatter.COLORS['yellow']
         reset = DisplayFormatter.COLORS['reset']
         
-        print(f"\n{bold}{'='*70}{reset}")
-        print(f"{bold}{'AVAILABLE COMMANDS':^70}{reset}")
-        print(f"{bold}{'='*70}{reset}\n")
+        out: List[str] = []  # Collected lines, written once at the end
+        
+        out.append(f"\n{bold}{'='*70}{reset}")
+        out.append(f"{bold}{'AVAILABLE COMMANDS':^70}{reset}")
+        out.append(f"{bold}{'='*70}{reset}\n")
         
         # Group commands by category
         auth_cmds = [
@@ -237,30 +278,34 @@ class DisplayFormatter:
         ]
         
         # Print Authentication
-        print(f"{yellow}▶ Authentication:{reset}")
+        out.append(f"{yellow}▶ Authentication:{reset}")
         for cmd, desc, example in auth_cmds:
-            print(f"  {cyan}{cmd:<30}{reset} {desc}")
-            print(f"    {green}Example: {example}{reset}\n")
+            out.append(f"  {cyan}{cmd:<30}{reset} {desc}")
+            out.append(f"    {green}Example: {example}{reset}\n")
         
         # Print View Commands
-        print(f"{yellow}▶ View Schedule:{reset}")
+        out.append(f"{yellow}▶ View Schedule:{reset}")
         for cmd, desc, example in view_cmds:
-            print(f"  {cyan}{cmd:<30}{reset} {desc}")
-            print(f"    {green}Example: {example}{reset}\n")
+            out.append(f"  {cyan}{cmd:<30}{reset} {desc}")
+            out.append(f"    {green}Example: {example}{reset}\n")
         
         # Print Management Commands
-        print(f"{yellow}▶ Manage Reservations:{reset}")
+        out.append(f"{yellow}▶ Manage Reservations:{reset}")
         for cmd, desc, example in manage_cmds:
-            print(f"  {cyan}{cmd:<30}{reset} {desc}")
-            print(f"    {green}Example: {example}{reset}\n")
+            out.append(f"  {cyan}{cmd:<30}{reset} {desc}")
+            out.append(f"    {green}Example: {example}{reset}\n")
         
         # Print Other Commands
-        print(f"{yellow}▶ Other:{reset}")
+        out.append(f"{yellow}▶ Other:{reset}")
         for cmd, desc, example in other_cmds:
-            print(f"  {cyan}{cmd:<30}{reset} {desc}")
-            print(f"    {green}Example: {example}{reset}\n")
+            out.append(f"  {cyan}{cmd:<30}{reset} {desc}")
+            out.append(f"    {green}Example: {example}{reset}\n")
+        
+        out.append(f"{bold}{'─'*70}{reset}")
+        out.append(f"{bold}Note:{reset} Days are: MON, TUE, WED, THU, FRI, SAT, SUN")
+        out.append(f"{bold}Note:{reset} Hours are: 9-22 (e.g., 9 = 09:00-10:00, 14 = 14:00-15:00)")
+        out.append(f"{bold}Note:{reset} Chain commands with ';' to send them in one request")
+        out.append(f"      {green}Example: make_res MON 14; make_res TUE 15; show_my_res{reset}")
+        out.append(f"{bold}{'─'*70}{reset}\n")
         
-        print(f"{bold}{'─'*70}{reset}")
-        print(f"{bold}Note:{reset} Days are: MON, TUE, WED, THU, FRI, SAT, SUN")
-        print(f"{bold}Note:{reset} Hours are: 9-22 (e.g., 9 = 09:00-10:00, 14 = 14:00-15:00)")
-        print(f"{bold}{'─'*70}{reset}\n")
+        return "\n".join(out) + "\n"
@@ -8,18 +8,29 @@ Why? - Consistent error handling
 """
 
 import socket
+import threading
 import json
-from typing import Dict, Tuple, Optional, Any
+from typing import Dict, List, Tuple, Optional, Any
+
+
+# Design Decision: One reused compact encoder for request bodies
+# Why? - Same as the server: no spaces, no per-call encoder setup
+# Alternative (not chosen): orjson/ujson - faster, but third-party
+_json_encoder = json.JSONEncoder(separators=(',', ':'))
 
 
 class HTTPClient:
     """
     HTTP client for communicating with tennis court server.
     
-    Design Decision: Stateless client (token passed per request)
-    Why? - Thread-safe
-         - Simple to reason about
+    Design Decision: Token passed per request (not stored here)
+    Why? - Simple to reason about
          - Token managed by SessionManager
+    
+    Design Decision: One persistent TCP connection (HTTP/1.1 keep-alive)
+    Why? - Every REPL command is one request
+         - Opening a new socket per command costs a full TCP handshake
+         - Reconnect transparently if the server closed the idle socket
     """
     
     def __init__(self, host: str, port: int):
@@ -29,9 +40,208 @@ class HTTPClient:
         Args:
             host: Server hostname/IP
             port: Server port
+        
+        Design Decision: Connect lazily
+        Why? - No socket until the first command is sent
+             - Same code path for first connect and reconnect
         """
         self.host = host
         self.port = port
+        self._conn: Optional[socket.socket] = None
+        self._rfile = None  # Buffered reader over self._conn
+        
+        # Design Decision: Precompute the fixed part of each request
+        # Why? - Host/Connection never change for this client
+        #      - The hot endpoints (login, schedule, reservations) have a
+        #        fixed method + path, so their request line is constant too
+        #      - Per call only the token / body bytes are appended
+        self._common_headers = (
+            f"Host: {host}:{port}\r\n".encode('utf-8') +
+            b"Connection: keep-alive\r\n"
+        )
+        self._req_login = (
+            b"POST /login HTTP/1.1\r\n" + self._common_headers +
+            b"Content-Type: application/json\r\n"
+        )
+        self._req_schedule = b"GET /schedule HTTP/1.1\r\n" + self._common_headers
+        self._req_reservations = b"GET /reservations HTTP/1.1\r\n" + self._common_headers
+        
+        # Serializes use of the connection (warm_up runs on another thread)
+        self._lock = threading.Lock()
+    
+    def warm_up(self):
+        """
+        Open the connection in the background.
+        
+        Design Decision: Connect while the user is still typing
+        Why? - The TCP handshake overlaps with user think-time
+             - First command doesn't pay the connect round trip
+             - REPL stays responsive (no blocking at startup)
+        
+        Errors are ignored here; the first real request reports them.
+        """
+        def connect():
+            with self._lock:
+                if self._conn is None:
+                    try:
+                        self._connect()
+                    except OSError:
+                        pass
+        
+        threading.Thread(target=connect, daemon=True).start()
+    
+    def _connect(self) -> socket.socket:
+        """Open a new TCP connection to the server."""
+        conn = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        conn.settimeout(10)  # 10 second timeout
+        try:
+            conn.connect((self.host, self.port))
+        except OSError:
+            conn.close()
+            raise
+        self._tune_socket(conn)
+        self._conn = conn
+        # Design Decision: 64 KiB buffered reader for responses
+        # Why? - readline() for the head, read(n) for the body
+        #      - Whole weekly schedule fits in one buffer fill
+        self._rfile = conn.makefile('rb', buffering=65536)
+        return conn
+    
+    @staticmethod
+    def _tune_socket(sock: socket.socket):
+        """
+        Set TCP options for small request/response traffic.
+        
+        TCP_NODELAY: Send each request immediately (no Nagle delay)
+        SO_KEEPALIVE: Let the OS detect a server that vanished
+        """
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        except OSError:
+            pass  # Tuning only - the connection still works without it
+    
+    def _close_conn(self):
+        """Drop the persistent connection (next request reconnects)."""
+        if self._conn is not None:
+            try:
+                self._rfile.close()
+                self._conn.close()
+            except OSError:
+                pass
+            self._conn = None
+            self._rfile = None
+    
+    def close(self):
+        """
+        Close the persistent connection (e.g. when the client exits).
+        
+        Safe to call more than once; a later request simply reconnects.
+        """
+        with self._lock:
+            self._close_conn()
+    
+    def _request(self, request_bytes: bytes) -> bytes:
+        """
+        Send raw request bytes and return the raw response bytes.
+        
+        Teaching Point: Keep-alive connections can go stale
+        The server closes idle sockets, so a reused connection may fail
+        with a broken pipe / reset. In that case we reconnect and retry
+        exactly once. A fresh connection failing is a real error.
+        """
+        with self._lock:
+            try:
+                return self._request_locked(request_bytes)
+            except Exception:
+                # Connection state is unknown - start fresh next time
+                self._close_conn()
+                raise
+    
+    def _request_locked(self, request_bytes: bytes) -> bytes:
+        """Body of _request(); caller holds self._lock."""
+        reused = self._conn is not None
+        conn = self._conn if reused else self._connect()
+        
+        try:
+            conn.sendall(request_bytes)
+            return self._read_response(conn)
+        except (BrokenPipeError, ConnectionResetError, ConnectionAbortedError):
+            self._close_conn()
+            if not reused:
+                raise
+        
+        # Stale keep-alive connection: retry once on a fresh socket
+        conn = self._connect()
+        conn.sendall(request_bytes)
+        return self._read_response(conn)
+    
+    def _read_response(self, conn: socket.socket) -> bytes:
+        """
+        Read exactly one HTTP response from the connection.
+        
+        Design Decision: Use Content-Length to find the end of the body
+        Why? - Connection stays open, so EOF no longer marks the end
+             - Server always sends Content-Length
+        
+        Raises:
+            ConnectionResetError: Server closed before replying (retryable)
+            ConnectionError: Truncated or unframed response
+            socket.timeout: Server didn't answer in time
+        """
+        conn.settimeout(5)  # 5 second timeout for response
+        rfile = self._rfile
+        head = bytearray()
+        keep_alive = True
+        
+        # Design Decision: A timeout is an error, not "end of response"
+        # Why? - The end is known from Content-Length, so waiting
+        #        longer never completes a response; socket.timeout
+        #        propagates and send_request reports it
+        
+        # Status line
+        line = rfile.readline()
+        if not line:
+            # Server closed the (idle) connection before replying
+            raise ConnectionResetError("Connection closed by server")
+        head += line
+        
+        # Headers, up to the blank line
+        # Extract Content-Length and Connection on the way
+        content_length = None
+        while True:
+            line = rfile.readline()
+            if not line:
+                # Not ConnectionResetError: the request may have been
+                # processed, so it must not be retried
+                raise ConnectionError("Incomplete response from server")
+            head += line
+            if line in (b"\r\n", b"\n"):
+                break
+            
+            # Lowercase only the name-sized prefix, not the whole line
+            prefix = line[:15].lower()
+            if prefix == b"content-length:":
+                content_length = int(line[15:])  # int() skips spaces/CRLF
+            elif prefix[:11] == b"connection:" and b"close" in line[11:].lower():
+                keep_alive = False
+        
+        # Body: exactly Content-Length bytes
+        if content_length is not None:
+            body = rfile.read(content_length)
+            if len(body) < content_length:
+                raise ConnectionError("Incomplete response from server")
+        elif not keep_alive:
+            # No length, but the server closes: the body runs to EOF
+            body = rfile.read()
+        else:
+            # No way to tell where this response ends on a kept-alive socket
+            raise ConnectionError("Response without Content-Length")
+        
+        if not keep_alive:
+            self._close_conn()
+        
+        return bytes(head) + body
     
     def send_request(
         self,
@@ -58,34 +268,26 @@ class HTTPClient:
              - Type-safe return value
         """
         try:
-            # Build request
-            request_lines = [
-                f"{method} {path} HTTP/1.1",
-                f"Host: {self.host}:{self.port}"
-            ]
-            
-            # Add authentication header if token provided
-            if token:
-                request_lines.append(f"Authorization: Bearer {token}")
-            
-            # Add body if present
-            if body:
-                body_json = json.dumps(body)
-                request_lines.append("Content-Type: application/json")
-                request_lines.append(f"Content-Length: {len(body_json)}")
-                request_lines.append("")  # Blank line before body
-                request_lines.append(body_json)
-            else:
-                request_lines.append("")  # Blank line
-            
-            request_str = "\r\n".join(request_lines)
-            
-            # Create socket and connect
-            client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            client_socket.settimeout(10)  # 10 second timeout
-            
+            request_bytes = self._build_request(method, path, body, token)
+        except Exception as e:
+            return -1, {
+                "success": False,
+                "message": f"Error: {str(e)}"
+            }
+        
+        return self._exchange(request_bytes)
+    
+    def _exchange(self, request_bytes: bytes) -> Tuple[int, Dict[str, Any]]:
+        """
+        Send one fully built request and return (status_code, body_dict).
+        
+        Shared by send_request() and the precomputed endpoint methods,
+        so both report connection errors the same way.
+        """
+        try:
+            # Send over the persistent connection (connects if needed)
             try:
-                client_socket.connect((self.host, self.port))
+                response_data = self._request(request_bytes)
             except ConnectionRefusedError:
                 return -1, {
                     "success": False,
@@ -97,83 +299,7 @@ class HTTPClient:
                     "message": "Connection timeout. Server not responding."
                 }
             
-            # Send request
-            client_socket.sendall(request_str.encode('utf-8'))
-            
-            # Receive response
-            response_data = b""
-            client_socket.settimeout(5)  # 5 second timeout for response
-            
-            try:
-                while True:
-                    chunk = client_socket.recv(4096)
-                    if not chunk:
-                        break
-                    response_data += chunk
-                    
-                    # Check if we have complete headers
-                    if b'\r\n\r\n' in response_data:
-                        header_end = response_data.find(b'\r\n\r\n')
-                        headers = response_data[:header_end].decode('utf-8')
-                        
-                        # Extract Content-Length
-                        content_length = None
-                        for line in headers.split('\r\n'):
-                            if line.lower().startswith('content-length:'):
-                                content_length = int(line.split(':')[1].strip())
-                                break
-                        
-                        # Check if we have all the body
-                        if content_length is not None:
-                            body_received = len(response_data) - header_end - 4
-                            if body_received >= content_length:
-                                break
-                        else:
-                            # No content-length, assume done
-                            break
-            except socket.timeout:
-                # Timeout means we got all data
-                pass
-            
-            client_socket.close()
-            
-            # Parse response
-            if not response_data:
-                return -1, {
-                    "success": False,
-                    "message": "No response from server"
-                }
-            
-            response_str = response_data.decode('utf-8')
-            
-            # Extract status code
-            status_line = response_str.split('\r\n')[0]
-            status_parts = status_line.split(' ')
-            
-            if len(status_parts) < 2:
-                return -1, {
-                    "success": False,
-                    "message": "Invalid response format"
-                }
-            
-            status_code = int(status_parts[1])
-            
-            # Extract body
-            body_start = response_str.find('\r\n\r\n') + 4
-            body_str = response_str[body_start:]
-            
-            if body_str:
-                try:
-                    body_dict = json.loads(body_str)
-                except json.JSONDecodeError:
-                    return status_code, {
-                        "success": False,
-                        "message": f"Invalid JSON response: {body_str[:100]}"
-                    }
-            else:
-                body_dict = {"success": True, "message": "No content"}
-            
-            return status_code, body_dict
+            return self._parse_response(response_data)
             
         except Exception as e:
             return -1, {
@@ -181,6 +307,85 @@ class HTTPClient:
                 "message": f"Error: {str(e)}"
             }
     
+    def _build_request(
+        self,
+        method: str,
+        path: str,
+        body: Optional[Dict],
+        token: Optional[str]
+    ) -> bytes:
+        """Render one HTTP request as bytes (joined once, no re-encode)."""
+        request_parts = [
+            f"{method} {path} HTTP/1.1\r\n".encode('utf-8'),
+            self._common_headers
+        ]
+        
+        # Add authentication header if token provided
+        if token:
+            request_parts.append(f"Authorization: Bearer {token}\r\n".encode('utf-8'))
+        
+        # Add body if present
+        if body:
+            body_json = _json_encoder.encode(body).encode('utf-8')
+            request_parts.append(b"Content-Type: application/json\r\n")
+            request_parts.append(b"Content-Length: %d\r\n\r\n" % len(body_json))
+            request_parts.append(body_json)
+        else:
+            request_parts.append(b"\r\n")  # End of headers
+        
+        return b"".join(request_parts)
+    
+    @staticmethod
+    def _auth_tail(token: Optional[str]) -> bytes:
+        """Authorization header (if any) plus the blank line ending the headers."""
+        if token:
+            return f"Authorization: Bearer {token}\r\n\r\n".encode('utf-8')
+        return b"\r\n"
+    
+    @staticmethod
+    def _parse_response(response_data: bytes) -> Tuple[int, Dict[str, Any]]:
+        """
+        Parse raw response bytes into (status_code, response_body_dict).
+        
+        Design Decision: Parse the response as bytes
+        Why? - No decode of the whole response to str
+             - json.loads() accepts the body bytes directly
+        """
+        if not response_data:
+            return -1, {
+                "success": False,
+                "message": "No response from server"
+            }
+        
+        # Extract status code
+        status_line = response_data.split(b'\r\n', 1)[0]
+        status_parts = status_line.split(b' ')
+        
+        if len(status_parts) < 2:
+            return -1, {
+                "success": False,
+                "message": "Invalid response format"
+            }
+        
+        status_code = int(status_parts[1])
+        
+        # Extract body
+        body_start = response_data.find(b'\r\n\r\n') + 4
+        body_bytes = response_data[body_start:]
+        
+        if body_bytes:
+            try:
+                body_dict = json.loads(body_bytes)
+            except ValueError:
+                return status_code, {
+                    "success": False,
+                    "message": f"Invalid JSON response: {body_bytes[:100].decode('utf-8', 'replace')}"
+                }
+        else:
+            body_dict = {"success": True, "message": "No content"}
+        
+        return status_code, body_dict
+    
     def login(self, username: str, password: str) -> Tuple[bool, str, Optional[str]]:
         """
         Attempt to login to server.
@@ -193,10 +398,13 @@ class HTTPClient:
              - Clear return type
              - Hides HTTP details from caller
         """
-        status, body = self.send_request(
-            "POST",
-            "/login",
-            body={"username": username, "password": password}
+        body_json = _json_encoder.encode(
+            {"username": username, "password": password}
+        ).encode('utf-8')
+        status, body = self._exchange(
+            self._req_login +
+            b"Content-Length: %d\r\n\r\n" % len(body_json) +
+            body_json
         )
         
         if status == 200 and body.get('success'):
@@ -214,7 +422,7 @@ class HTTPClient:
         Returns:
             Tuple of (success, message, schedule_data)
         """
-        status, body = self.send_request("GET", "/schedule", token=token)
+        status, body = self._exchange(self._req_schedule + self._auth_tail(token))
         
         if status == 200 and body.get('success'):
             schedule = body.get('data', {}).get('schedule')
@@ -252,7 +460,7 @@ class HTTPClient:
         Returns:
             Tuple of (success, message, reservations_list)
         """
-        status, body = self.send_request("GET", "/reservations", token=token)
+        status, body = self._exchange(self._req_reservations + self._auth_tail(token))
         
         if status == 200 and body.get('success'):
             reservations = body.get('data', {}).get('reservations', [])
@@ -301,3 +509,39 @@ class HTTPClient:
         success = status == 200 and body.get('success')
         message = body.get('message', 'Cancellation failed')
         return success, message
+    
+    def batch(
+        self,
+        token: str,
+        ops: List[Dict[str, Any]],
+        stop_on_error: bool = False
+    ) -> Tuple[bool, str, Optional[list]]:
+        """
+        Send several API calls in one request (POST /batch).
+        
+        Args:
+            token: Authentication token
+            ops: List of {"method": ..., "path": ..., "body": ...} dicts
+            stop_on_error: Stop at the first failing operation
+        
+        Returns:
+            Tuple of (success, message, results_list)
+            Each result is {"status": int, "body": {...}}, in op order.
+        
+        Design Decision: One round trip for many commands
+        Why? - "make_res MON 14; make_res TUE 15" costs 1 RTT instead of 2
+        """
+        status, body = self.send_request(
+            "POST",
+            "/batch",
+            body={"ops": ops, "stop_on_error": stop_on_error},
+            token=token
+        )
+        
+        if status == 200 and body.get('success'):
+            results = body.get('data', {}).get('results', [])
+            message = body.get('message', 'Batch executed')
+            return True, message, results
+        else:
+            message = body.get('message', 'Batch failed')
+            return False, message, None
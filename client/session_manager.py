@@ -18,8 +18,14 @@ class SessionManager:
     Why? - Console app has one user at a time
          - No concurrent session needs
          - Simple state management
+    
+    Design Decision: __slots__ instead of a per-instance __dict__
+    Why? - Only two attributes, read on every command
+         - Smaller instance, faster attribute access
     """
     
+    __slots__ = ('token', 'username')
+    
     def __init__(self):
         """Initialize session manager with no active session."""
         self.token: Optional[str] = None
@@ -46,7 +52,8 @@ class SessionManager:
     
     def is_logged_in(self) -> bool:
         """Check if user is currently logged in."""
-        return self.token is not None and self.username is not None
+        # login()/logout() always set token and username together
+        return self.token is not None
     
     def get_token(self) -> Optional[str]:
         """Get current session token."""
@@ -7,10 +7,36 @@ Why? - Security concerns isolated in one place
      - Testable without network layer
 """
 
-import uuid
+import heapq
+import hmac
+import secrets
+import threading
+import time
+from hashlib import blake2b
 from datetime import datetime
-from typing import Optional, Dict
-from server.models import Session, PREDEFINED_USERS
+from typing import Optional, Dict, List, Tuple
+from server.models import Session, PREDEFINED_USERS, SESSION_TTL_SECONDS
+
+
+# Design Decision: Compare password digests, not the passwords themselves
+# Why? - One dict lookup + hmac.compare_digest (constant-time compare)
+#      - "Unknown user" and "wrong password" take the same time
+#      - Call sites stay the same if real password hashing is added later
+# The pepper is random per process, so digests are useless outside it
+_PEPPER = secrets.token_bytes(32)
+
+
+def _password_digest(password: str) -> bytes:
+    return blake2b(password.encode('utf-8'), digest_size=16, key=_PEPPER).digest()
+
+
+_PASSWORD_DIGESTS = {
+    username: _password_digest(password)
+    for username, password in PREDEFINED_USERS.items()
+}
+
+# Compared against for unknown users, so they cost the same as a wrong password
+_NO_USER_DIGEST = _password_digest(secrets.token_urlsafe(16))
 
 
 class AuthenticationManager:
@@ -30,11 +56,13 @@ class AuthenticationManager:
     Security Note: This is simplified for educational purposes.
     Production would need:
     - Password hashing (bcrypt, argon2)
-    - Token expiration
     - HTTPS for transport security
     - Rate limiting on login attempts
     """
     
+    # Power of two, so picking a shard is a bit mask instead of a modulo
+    SHARD_COUNT = 16
+    
     def __init__(self):
         """
         Initialize authentication manager.
@@ -43,8 +71,74 @@ class AuthenticationManager:
         Why? - Fast lookup O(1)
              - Simple for single-server
              - Sessions lost on restart (acceptable per requirements)
+        
+        Thread Safety: Sessions are split over SHARD_COUNT dicts,
+        each guarded by its own lock
+        Why? - Requests are handled concurrently by the server's worker pool
+             - validate_token() runs on every request; with one lock every
+               request would queue behind every other one
+             - A token always hashes to the same shard, so two requests
+               only contend when their tokens share a shard
         """
-        self.active_sessions: Dict[str, Session] = {}
+        self._shards: Tuple[Dict[bytes, Session], ...] = tuple(
+            {} for _ in range(self.SHARD_COUNT)
+        )
+        self._shard_locks = tuple(threading.Lock() for _ in range(self.SHARD_COUNT))
+        
+        # Secret key for _session_key(); new on every start, never sent out
+        self._token_key = secrets.token_bytes(32)
+        
+        # Design Decision: Min-heap of (expires_at, session key)
+        # Why? - Sessions that are never used again (no logout) would
+        #        otherwise stay in memory forever
+        #      - The soonest expiry is always at heap[0], so a sweep only
+        #        touches sessions that are actually expired
+        # Swept on login and on count, not in validate_token(): the heap
+        # has one lock, and the per-request path should only take a shard lock
+        self._expiry_heap: List[Tuple[float, bytes]] = []
+        self._expiry_lock = threading.Lock()
+        
+        # Design Decision: One session per user (username -> session key)
+        # Why? - Logging in again replaces the old token instead of
+        #        leaving it alive next to the new one
+        #      - Sessions stay bounded by the number of users
+        # Guarded by _expiry_lock; the replaced key's heap entry goes
+        # stale and is skipped when it reaches the top
+        self._user_keys: Dict[str, bytes] = {}
+    
+    def _session_key(self, token: str) -> bytes:
+        """
+        Map a client-supplied token to the dict key its session is stored under.
+        
+        Design Decision: Key sessions by a keyed BLAKE2b digest of the token
+        Why? - Every key is 16 bytes, however long the Authorization header
+               was, so a huge bogus token is never kept around as a key
+             - Keyed with a per-process secret, so digests can't be
+               precomputed by a client
+        
+        The client still sees and sends the plain token.
+        """
+        return blake2b(token.encode('utf-8'), digest_size=16, key=self._token_key).digest()
+    
+    def _evict_expired(self):
+        """Drop every session whose deadline has passed (oldest first)."""
+        now = time.monotonic()
+        with self._expiry_lock:
+            heap = self._expiry_heap
+            while heap and heap[0][0] < now:
+                _, key = heapq.heappop(heap)
+                sessions, lock = self._shard(key)
+                with lock:
+                    session = sessions.pop(key, None)
+                if session is None:
+                    continue  # Stale entry: logged out or replaced already
+                if self._user_keys.get(session.username) == key:
+                    del self._user_keys[session.username]
+    
+    def _shard(self, key: bytes):
+        """Return the (sessions dict, lock) pair that owns this session key."""
+        index = hash(key) & (self.SHARD_COUNT - 1)
+        return self._shards[index], self._shard_locks[index]
     
     def authenticate(self, username: str, password: str) -> Optional[str]:
         """
@@ -64,29 +158,52 @@ class AuthenticationManager:
         
         Teaching Point: This implements HTTP "stateful" session pattern
         Server remembers who you are via token in subsequent requests
+        
+        Logging in again ends the user's previous session (its token
+        is no longer valid).
         """
-        # Validate credentials
-        if username not in PREDEFINED_USERS:
+        # Credentials come straight from the JSON body, so may be any type
+        if not isinstance(username, str) or not isinstance(password, str):
             return None
         
-        if PREDEFINED_USERS[username] != password:
+        # Validate credentials
+        expected = _PASSWORD_DIGESTS.get(username)
+        given = _password_digest(password)
+        valid = hmac.compare_digest(expected or _NO_USER_DIGEST, given)
+        if expected is None or not valid:
             return None
         
         # Generate unique session token
-        # Design Decision: UUID4 for token generation
-        # Why? - Cryptographically random
+        # Design Decision: secrets.token_urlsafe for token generation
+        # Why? - Cryptographically random (meant for security tokens)
         #      - Extremely low collision probability
         #      - Standard Python library
-        token = str(uuid.uuid4())
+        token = secrets.token_urlsafe(16)
         
         # Create session
         session = Session(
             username=username,
             token=token,
-            login_time=datetime.now()
+            login_time=datetime.now(),
+            expires_at=time.monotonic() + SESSION_TTL_SECONDS
         )
         
-        self.active_sessions[token] = session
+        key = self._session_key(token)
+        sessions, lock = self._shard(key)
+        with lock:
+            sessions[key] = session
+        
+        self._evict_expired()
+        with self._expiry_lock:
+            heapq.heappush(self._expiry_heap, (session.expires_at, key))
+            
+            # Re-login: the user's previous token stops working
+            old_key = self._user_keys.get(username)
+            self._user_keys[username] = key
+            if old_key is not None:
+                old_sessions, old_lock = self._shard(old_key)
+                with old_lock:
+                    old_sessions.pop(old_key, None)
         
         return token
     
@@ -106,11 +223,21 @@ class AuthenticationManager:
         
         Teaching Point: This is called on EVERY request after login
         to verify the user is authenticated
+        
+        Design Decision: Evict expired sessions lazily, right here
+        Why? - One dict lookup + one compare on the hot path
+             - No background cleanup thread needed
         """
-        session = self.active_sessions.get(token)
-        if session is None:
-            return None
-        return session.username
+        key = self._session_key(token)
+        sessions, lock = self._shard(key)
+        with lock:
+            session = sessions.get(key)
+            if session is None:
+                return None
+            if session.expires_at < time.monotonic():
+                del sessions[key]
+                return None
+            return session.username
     
     def logout(self, token: str) -> bool:
         """
@@ -126,10 +253,17 @@ class AuthenticationManager:
         Why? - Idempotent operation (safe to call multiple times)
              - Client doesn't need to check before logging out
         """
-        if token in self.active_sessions:
-            del self.active_sessions[token]
-            return True
-        return False
+        key = self._session_key(token)
+        sessions, lock = self._shard(key)
+        with lock:
+            session = sessions.pop(key, None)
+        if session is None:
+            return False
+        
+        with self._expiry_lock:
+            if self._user_keys.get(session.username) == key:
+                del self._user_keys[session.username]
+        return True
     
     def get_session_info(self, token: str) -> Optional[Dict]:
         """
@@ -145,7 +279,10 @@ class AuthenticationManager:
         Why? - Easy to serialize to JSON for API responses
              - Don't expose internal objects
         """
-        session = self.active_sessions.get(token)
+        key = self._session_key(token)
+        sessions, lock = self._shard(key)
+        with lock:
+            session = sessions.get(key)
         if session is None:
             return None
         return session.to_dict()
@@ -156,7 +293,12 @@ class AuthenticationManager:
         
         Teaching Point: Useful for monitoring/debugging
         """
-        return len(self.active_sessions)
+        self._evict_expired()
+        count = 0
+        for sessions, lock in zip(self._shards, self._shard_locks):
+            with lock:
+                count += len(sessions)
+        return count
     
     def clear_all_sessions(self):
         """
@@ -166,4 +308,9 @@ class AuthenticationManager:
         Why? - Useful for testing
              - Could be used for "logout all users" feature
         """
-        self.active_sessions.clear()
+        with self._expiry_lock:
+            self._expiry_heap.clear()
+            self._user_keys.clear()
+        for sessions, lock in zip(self._shards, self._shard_locks):
+            with lock:
+                sessions.clear()
@@ -17,7 +17,14 @@ class Reservation:
     Why? - Simpler weekly schedule management (no year/date complications)
          - Direct mapping to user commands (e.g., "WED 14")
          - Easier to display and query
+    
+    Design Decision: __slots__ instead of a per-instance __dict__
+    Why? - Smaller objects, faster attribute access
+         - dataclass(slots=True) needs Python 3.10; an explicit
+           __slots__ works on 3.7+ as long as fields have no defaults
     """
+    __slots__ = ('username', 'day', 'hour')
+    
     username: str
     day: str        # MON, TUE, WED, THU, FRI, SAT, SUN
     hour: int       # 9-22 (representing 09:00-10:00, ..., 22:00-23:00)
@@ -40,14 +47,20 @@ class Session:
     """
     Represents an active user session.
     
-    Design Decision: Include login_time for potential session expiry
-    Why? - Could add timeout feature later
-         - Useful for debugging/logging
+    Design Decision: Include login_time for debugging/logging
+    Why? - Shows when the user logged in
          - Minimal overhead
+    
+    Design Decision: Expiry as a time.monotonic() deadline
+    Why? - Not affected by wall-clock changes
+         - Validating is a single float compare
     """
+    __slots__ = ('username', 'token', 'login_time', 'expires_at')
+    
     username: str
     token: str
     login_time: datetime
+    expires_at: float   # time.monotonic() value after which token is invalid
     
     def to_dict(self):
         return {
@@ -65,6 +78,14 @@ class Session:
 DAYS = ["MON", "TUE", "WED", "THU", "FRI", "SAT", "SUN"]
 HOURS = list(range(9, 23))  # 9 to 22 inclusive (09:00-23:00)
 
+# Design Decision: Day name -> index (0 = MON) as a dict
+# Why? - Validating a day is one hash lookup, not a scan of DAYS
+#      - Same index is the row number in ScheduleStore's grid
+DAY_INDEX = {day: i for i, day in enumerate(DAYS)}
+
+# Same idea for hours: set membership instead of a scan of HOURS
+_HOUR_SET = frozenset(HOURS)
+
 # Design Decision: Hardcode users as per specification
 # Why? - Requirements explicitly state 10 predefined users
 #      - No user registration needed
@@ -73,13 +94,16 @@ PREDEFINED_USERS = {
     f"user{i}": str(i) for i in range(1, 11)
 }
 
+# Session lifetime - tokens older than this must log in again
+SESSION_TTL_SECONDS = 60 * 60  # 1 hour
+
 def is_valid_day(day: str) -> bool:
-    """Validate day name"""
-    return day.upper() in DAYS
+    """Validate day name (case-insensitive; canonical "MON" skips upper())"""
+    return day in DAY_INDEX or day.upper() in DAY_INDEX
 
 def is_valid_hour(hour: int) -> bool:
     """Validate hour is in allowed range"""
-    return hour in HOURS
+    return hour in _HOUR_SET
 
 def format_time_slot(hour: int) -> str:
     """Format hour as time slot string (e.g., '14:00-15:00')"""
@@ -46,6 +46,17 @@ class ReservationManager:
     1. One reservation per user per day
     2. No double-booking of slots
     3. Valid day/hour only
+    
+    Thread Safety: No lock of its own
+    Why? - TennisCourtServer runs every mutating call on its single
+           writer thread (see TennisCourtServer._write), so the rule
+           checks and the write (check-then-act) never interleave
+         - A lock here would only add acquire/release work to every change
+    Even if called concurrently, the store re-checks both rules under
+    its own lock, so a slot is never double-booked (the loser just gets
+    the "Unexpected error" message instead of the specific one).
+    Read-only methods can run anywhere: the store publishes changes
+    copy-on-write, so a reader always sees one consistent version.
     """
     
     def __init__(self, schedule_store: ScheduleStore):
@@ -220,8 +231,7 @@ class ReservationManager:
         if not is_valid_day(day):
             return False, f"Invalid day: {day}"
         
-        schedule = self.store.get_day_schedule(day)
-        return True, schedule
+        return True, self.store.get_day_schedule(day)
     
     def reset_weekly_schedule(self):
         """
@@ -9,53 +9,125 @@ Why? - Testable in isolation
 """
 
 import json
-from typing import Optional, Dict, List
-from server.models import Reservation, DAYS, HOURS
+import os
+import pickle
+import threading
+from typing import Optional, Dict, List, Tuple
+from server.models import Reservation, DAYS, HOURS, DAY_INDEX
+
+
+# Slot index: DAY_INDEX[day] * hours per day + (hour - first hour)
+_FIRST_HOUR = HOURS[0]
+_HOURS_PER_DAY = len(HOURS)
+
+# Slot labels never change, so format them once
+_TIME_SLOTS = [f"{hour:02d}:00-{hour+1:02d}:00" for hour in HOURS]
+
+# JSON object keys are strings: "9" -> 9, for the valid hours only
+# (pickle keeps int keys, so those map to themselves)
+_HOUR_KEYS = {str(hour): hour for hour in HOURS}
+_HOUR_KEYS.update({hour: hour for hour in HOURS})
+
+# Shared default for users without reservations: .get(user, _NO_DAYS)
+# doesn't build a new {} on every call. Never modified (updates are
+# copy-on-write, see ScheduleStore).
+_NO_DAYS: Dict[str, int] = {}
+
+# Supported persistence file formats (see ScheduleStore.__init__)
+_FILE_FORMATS = ("json", "pickle")
+
+
+def _slot_index(day: str, hour: int) -> Optional[int]:
+    """Position of (day, hour) in the flat slot list, or None if out of range."""
+    row = DAY_INDEX.get(day)
+    col = hour - _FIRST_HOUR
+    if row is None or not 0 <= col < _HOURS_PER_DAY:
+        return None
+    return row * _HOURS_PER_DAY + col
 
 
 class ScheduleStore:
     """
     Manages the tennis court schedule data.
     
-    Design Decision: Use nested dictionary for O(1) lookups
-    Structure: {day: {hour: username or None}}
+    Design Decision: One flat list of 98 slots for O(1) lookups
+    Structure: slots[day_index * 14 + (hour - 9)] = username or None
     
     Why this structure?
-    - Fast lookup: schedule[day][hour] is O(1)
-    - Easy iteration: Can list all slots or filter by day
+    - Fast lookup: index arithmetic + one list index, no hashing
+    - Easy iteration: a day is one contiguous slice, in hour order
     - Simple state: None = available, username = occupied
+    
+    Design Decision: Keep a per-user index next to the slots
+    Structure: by_user[username] = {day: hour}
+    Why? - "My reservations" and the one-per-day rule are O(1)
+           instead of scanning all 98 slots
+         - Updated in the same place as the slots, so they never disagree
+    
+    Design Decision: Copy-on-write updates, lock-free reads
+    Why? - Reads (viewing the schedule) are far more common than writes
+         - Writers (under the lock) build a new slot list / new per-user
+           dict and publish it with one attribute or dict assignment
+         - Readers grab the current object once and never see it change
+    Teaching Point: This is the RCU idea (read-copy-update). It works
+    here because a copy is 98 references and writes are rare.
     """
     
-    def __init__(self, persistence_file: Optional[str] = None):
+    def __init__(self, persistence_file: Optional[str] = None, file_format: str = "json"):
         """
         Initialize the schedule store.
         
         Args:
             persistence_file: Optional file path for saving/loading schedule
+            file_format: "json" (default, human-readable) or "pickle"
         
         Design Decision: Optional file persistence
         Why? - Can run without file for testing
              - Production can enable persistence
+        
+        Design Decision: Pickle as an opt-in binary format
+        Why? - Smaller file, faster save/load than JSON
+             - Standard library (msgpack would be third-party)
+        Security Note: Only load pickle files this server wrote itself;
+        unpickling an untrusted file can run arbitrary code.
         """
+        if file_format not in _FILE_FORMATS:
+            raise ValueError(f"Unknown file format: {file_format}. Must be one of {_FILE_FORMATS}.")
+        
         self.persistence_file = persistence_file
-        self.schedule: Dict[str, Dict[int, Optional[str]]] = {}
+        self.file_format = file_format
+        self._slots: List[Optional[str]] = []
+        self._by_user: Dict[str, Dict[str, int]] = {}
+        
+        # Write-behind state: every mutation marks the schedule dirty,
+        # flush() writes it out later (see flush)
+        self._lock = threading.Lock()
+        self._dirty = False
+        
+        # Bytes of the last snapshot written (only touched by the flusher)
+        self._last_payload: Optional[bytes] = None
+        
+        # True while saves keep failing: warn once, not on every retry
+        self._save_failing = False
+        
         self._initialize_schedule()
         
         # Try to load from file if it exists
         if self.persistence_file:
             self._load_from_file()
+            self._dirty = False  # Loaded state is already on disk
     
     def _initialize_schedule(self):
         """
         Create empty schedule with all slots available.
         
         Design Decision: Initialize all slots explicitly
-        Why? - Easier to check availability (check None vs KeyError)
+        Why? - Easier to check availability (check None vs IndexError)
              - Clear state representation
              - Simpler iteration over all slots
         """
-        for day in DAYS:
-            self.schedule[day] = {hour: None for hour in HOURS}
+        self._slots = [None] * (len(DAYS) * _HOURS_PER_DAY)
+        self._by_user = {}
     
     def reset_schedule(self):
         """
@@ -64,9 +136,9 @@ class ScheduleStore:
         Teaching Point: This implements the requirement that
         "at the beginning of each week, the server refreshes the schedule"
         """
-        self._initialize_schedule()
-        if self.persistence_file:
-            self._save_to_file()
+        with self._lock:
+            self._initialize_schedule()
+            self._dirty = True
     
     def get_slot(self, day: str, hour: int) -> Optional[str]:
         """
@@ -84,7 +156,10 @@ class ScheduleStore:
              - Truthy/falsy checks work correctly
              - Type hint Optional[str] is clear
         """
-        return self.schedule.get(day, {}).get(hour)
+        index = _slot_index(day, hour)
+        if index is None:
+            return None
+        return self._slots[index]
     
     def is_slot_available(self, day: str, hour: int) -> bool:
         """Check if a slot is available for reservation."""
@@ -101,19 +176,15 @@ class ScheduleStore:
         
         Returns:
             True if successfully reserved, False if already taken
+            (or the user already has a slot that day)
         
         Design Decision: Return boolean for success/failure
         Why? - Caller can decide how to handle failure
              - No exceptions for business logic (reserved vs available)
              - Exceptions only for actual errors (invalid input)
         """
-        if not self.is_slot_available(day, hour):
-            return False
-        
-        self.schedule[day][hour] = username
-        if self.persistence_file:
-            self._save_to_file()
-        return True
+        with self._lock:
+            return self._reserve_locked(day, hour, username)
     
     def cancel_reservation(self, day: str, hour: int) -> bool:
         """
@@ -122,12 +193,79 @@ class ScheduleStore:
         Returns:
             True if reservation was cancelled, False if slot was already empty
         """
-        if self.is_slot_available(day, hour):
+        with self._lock:
+            return self._cancel_locked(day, hour)
+    
+    def reserve_slots_batch(self, items: List[Tuple[str, int, str]]) -> List[bool]:
+        """
+        Reserve several slots at once.
+        
+        Args:
+            items: List of (day, hour, username)
+        
+        Returns:
+            One success flag per item, in order (same meaning as reserve_slot)
+        
+        Design Decision: Apply the whole batch under one lock acquisition
+        Why? - Bulk callers (loading the file, seeding data) don't pay
+               the lock N times
+             - Other threads never see a half-applied batch
+             - Marks the schedule dirty once, so it is one file write
+        """
+        with self._lock:
+            return [self._reserve_locked(day, hour, username) for day, hour, username in items]
+    
+    def cancel_slots_batch(self, items: List[Tuple[str, int]]) -> List[bool]:
+        """
+        Cancel several reservations at once.
+        
+        Args:
+            items: List of (day, hour)
+        
+        Returns:
+            One success flag per item, in order (same meaning as cancel_reservation)
+        """
+        with self._lock:
+            return [self._cancel_locked(day, hour) for day, hour in items]
+    
+    def _reserve_locked(self, day: str, hour: int, username: str) -> bool:
+        """Body of reserve_slot(); caller holds self._lock."""
+        # One index computation, then one read + one write of the slot
+        index = _slot_index(day, hour)
+        if index is None or self._slots[index] is not None:
             return False
         
-        self.schedule[day][hour] = None
-        if self.persistence_file:
-            self._save_to_file()
+        # by_user holds one hour per day, so a second slot that day
+        # would break the index (ReservationManager checks this first)
+        if day in self._by_user.get(username, _NO_DAYS):
+            return False
+        
+        # Copy-on-write: readers holding the old list/dict are unaffected
+        slots = list(self._slots)
+        slots[index] = username
+        user_days = dict(self._by_user.get(username, _NO_DAYS))
+        user_days[day] = hour
+        self._slots = slots
+        self._by_user[username] = user_days
+        self._dirty = True
+        return True
+    
+    def _cancel_locked(self, day: str, hour: int) -> bool:
+        """Body of cancel_reservation(); caller holds self._lock."""
+        index = _slot_index(day, hour)
+        if index is None or self._slots[index] is None:
+            return False
+        
+        username = self._slots[index]
+        slots = list(self._slots)
+        slots[index] = None
+        self._slots = slots
+        user_days = self._by_user.get(username, _NO_DAYS)
+        if user_days.get(day) == hour:
+            user_days = dict(user_days)
+            del user_days[day]
+            self._by_user[username] = user_days
+        self._dirty = True
         return True
     
     def get_day_schedule(self, day: str) -> List[Dict]:
@@ -142,16 +280,22 @@ class ScheduleStore:
              - Easier to test
              - More flexible for different display formats
         """
-        result = []
-        for hour in HOURS:
-            username = self.get_slot(day, hour)
-            result.append({
+        return self._day_schedule(self._slots, DAY_INDEX[day])
+    
+    @staticmethod
+    def _day_schedule(slots: List[Optional[str]], day_index: int) -> List[Dict]:
+        """Build one day's slot dicts from a slots snapshot."""
+        start = day_index * _HOURS_PER_DAY
+        row = slots[start:start + _HOURS_PER_DAY]
+        return [
+            {
                 "hour": hour,
-                "time_slot": f"{hour:02d}:00-{hour+1:02d}:00",
+                "time_slot": time_slot,
                 "available": username is None,
                 "reserved_by": username
-            })
-        return result
+            }
+            for hour, time_slot, username in zip(HOURS, _TIME_SLOTS, row)
+        ]
     
     def get_weekly_schedule(self) -> Dict[str, List[Dict]]:
         """
@@ -159,8 +303,11 @@ class ScheduleStore:
         
         Returns:
             Dict mapping day names to their schedules
+        
+        All seven days come from the same snapshot of the slots.
         """
-        return {day: self.get_day_schedule(day) for day in DAYS}
+        slots = self._slots
+        return {day: self._day_schedule(slots, i) for i, day in enumerate(DAYS)}
     
     def get_user_reservations(self, username: str) -> List[Reservation]:
         """
@@ -174,12 +321,11 @@ class ScheduleStore:
              - Consistent with our data model
              - Can use Reservation methods
         """
-        reservations = []
-        for day in DAYS:
-            for hour in HOURS:
-                if self.get_slot(day, hour) == username:
-                    reservations.append(Reservation(username, day, hour))
-        return reservations
+        user_days = self._by_user.get(username, _NO_DAYS)
+        return [
+            Reservation(username, day, user_days[day])
+            for day in DAYS if day in user_days
+        ]
     
     def get_user_reservation_for_day(self, username: str, day: str) -> Optional[Reservation]:
         """
@@ -191,29 +337,104 @@ class ScheduleStore:
         Teaching Point: This implements the constraint
         "a user can make at most one reservation per day"
         """
-        for hour in HOURS:
-            if self.get_slot(day, hour) == username:
-                return Reservation(username, day, hour)
-        return None
+        hour = self._by_user.get(username, _NO_DAYS).get(day)
+        if hour is None:
+            return None
+        return Reservation(username, day, hour)
     
-    def _save_to_file(self):
+    def flush(self):
+        """
+        Write the schedule to file if it changed since the last flush.
+        
+        Design Decision: Write-behind persistence
+        Why? - Mutators only set a dirty flag, so request handlers never
+               wait for disk I/O
+             - A burst of N changes becomes a single file write
+             - The server's flusher thread calls this on an interval and
+               once more at shutdown
+        
+        Teaching Point: Copy under the lock, write outside it
+        The snapshot is taken while holding the lock (consistent view),
+        but the slow file write happens without blocking mutations.
         """
-        Save schedule to file.
+        if not self.persistence_file or not self._dirty:
+            return
+        
+        with self._lock:
+            self._dirty = False
+            slots = self._slots
+            snapshot = {
+                day: dict(zip(HOURS, slots[i * _HOURS_PER_DAY:(i + 1) * _HOURS_PER_DAY]))
+                for i, day in enumerate(DAYS)
+            }
         
-        Design Decision: Use JSON for human-readability
+        if not self._save_to_file(snapshot):
+            self._dirty = True  # Try again on the next flush
+    
+    def _save_to_file(self, schedule: Dict[str, Dict[int, Optional[str]]]) -> bool:
+        """
+        Save a schedule snapshot to file.
+        
+        Returns:
+            True if saved, False on error
+        
+        Design Decision: Use JSON for human-readability (default)
         Why? - Easy to inspect/debug
              - Standard format
              - Built-in Python support
         Alternative: Pickle - faster but binary, not readable
+                     (available with file_format="pickle")
+        
+        Design Decision: Write to a temp file, fsync, then os.replace()
+        Why? - Rename is atomic, so a crash mid-write never leaves a
+               half-written schedule file behind
+             - fsync before the rename: the new name never points at
+               data that is still only in the OS cache
+             - Only the flusher thread gets here, so the fsync never
+               delays a request
         """
         if not self.persistence_file:
-            return
+            return False
         
+        # Design Decision: Serialize in memory, then raw os.write() calls
+        # Why? - The snapshot is a few KB; no file-object buffer in between
+        #      - Normally a single write() system call
+        tmp_file = self.persistence_file + ".tmp"
         try:
-            with open(self.persistence_file, 'w') as f:
-                json.dump(self.schedule, f, indent=2)
+            if self.file_format == "pickle":
+                payload = pickle.dumps(schedule, protocol=pickle.HIGHEST_PROTOCOL)
+            else:
+                payload = json.dumps(schedule, indent=2).encode('utf-8')
+            
+            # Changes that cancel out (reserve, then cancel) leave the
+            # file content as it is - nothing to write
+            if payload == self._last_payload:
+                return True
+            
+            # O_BINARY (Windows only): no \n -> \r\n translation of the payload
+            flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+            fd = os.open(tmp_file, flags, 0o644)
+            try:
+                view = memoryview(payload)
+                while view:
+                    view = view[os.write(fd, view):]  # write() may be partial
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp_file, self.persistence_file)
+            self._last_payload = payload
+            if self._save_failing:
+                self._save_failing = False
+                print("Schedule file saved again.")
+            return True
         except Exception as e:
-            print(f"Warning: Could not save schedule to file: {e}")
+            # flush() retries on every interval; only the first failure
+            # of a run is reported (e.g. read-only disk, permissions)
+            if not self._save_failing:
+                self._save_failing = True
+                print(f"Warning: Could not save schedule to file: {e}")
+                print("Will keep retrying; further errors are not shown.")
+            return False
     
     def _load_from_file(self):
         """Load schedule from file if it exists."""
@@ -221,14 +442,21 @@ class ScheduleStore:
             return
         
         try:
-            with open(self.persistence_file, 'r') as f:
-                loaded = json.load(f)
-                # Validate loaded data structure
-                for day in DAYS:
-                    if day in loaded:
-                        for hour in HOURS:
-                            if str(hour) in loaded[day]:  # JSON keys are strings
-                                self.schedule[day][hour] = loaded[day][str(hour)]
+            if self.file_format == "pickle":
+                with open(self.persistence_file, 'rb') as f:
+                    loaded = pickle.load(f)
+            else:
+                with open(self.persistence_file, 'r') as f:
+                    loaded = json.load(f)
+            
+            # Validate loaded data structure: known days and hours only
+            items = []
+            for day in DAYS:
+                for key, username in loaded.get(day, {}).items():
+                    hour = _HOUR_KEYS.get(key)
+                    if hour is not None and username is not None:
+                        items.append((day, hour, username))
+            self.reserve_slots_batch(items)
         except FileNotFoundError:
             # First run, no file yet - that's fine
             pass
@@ -0,0 +1,114 @@
+"""
+AuthenticationManager tests - run from the repository root with:
+python -m unittest
+"""
+
+import types
+import unittest
+from unittest import mock
+
+from server import auth_manager
+from server.auth_manager import AuthenticationManager
+from server.models import SESSION_TTL_SECONDS
+
+
+class AuthenticateTest(unittest.TestCase):
+    """Credential checks in authenticate()."""
+    
+    def setUp(self):
+        self.auth = AuthenticationManager()
+    
+    def test_valid_credentials_return_token(self):
+        token = self.auth.authenticate('user1', '1')
+        self.assertIsNotNone(token)
+        self.assertEqual(self.auth.validate_token(token), 'user1')
+    
+    def test_wrong_password_or_unknown_user(self):
+        self.assertIsNone(self.auth.authenticate('user1', 'wrong'))
+        self.assertIsNone(self.auth.authenticate('nobody', '1'))
+    
+    def test_non_string_credentials_rejected(self):
+        # Same as a wrong password (401), not an exception (500)
+        for username, password in (('user1', 1), ('user1', None),
+                                   (['user1'], '1'), ({}, []), (1, 1)):
+            with self.subTest(username=username, password=password):
+                self.assertIsNone(self.auth.authenticate(username, password))
+
+
+class SessionExpiryTest(unittest.TestCase):
+    """TTL eviction, re-login and the expiry heap, on a patched clock."""
+    
+    def setUp(self):
+        self.now = 1000.0
+        clock = types.SimpleNamespace(monotonic=lambda: self.now)
+        patcher = mock.patch.object(auth_manager, 'time', clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.auth = AuthenticationManager()
+    
+    def test_session_expires_after_ttl(self):
+        token = self.auth.authenticate('user1', '1')
+        self.now += SESSION_TTL_SECONDS - 1
+        self.assertEqual(self.auth.validate_token(token), 'user1')
+        
+        self.now += 2
+        self.assertIsNone(self.auth.validate_token(token))
+        self.assertEqual(self.auth.get_active_session_count(), 0)
+    
+    def test_expired_sessions_evicted_without_validate(self):
+        # Sessions that are never used again are swept by the heap
+        for i in range(1, 6):
+            self.auth.authenticate(f'user{i}', str(i))
+        self.assertEqual(self.auth.get_active_session_count(), 5)
+        
+        self.now += SESSION_TTL_SECONDS + 1
+        self.auth.authenticate('user6', '6')  # Login sweeps the heap
+        self.assertEqual(self.auth.get_active_session_count(), 1)
+        self.assertEqual(len(self.auth._expiry_heap), 1)
+    
+    def test_relogin_replaces_old_token(self):
+        old = self.auth.authenticate('user1', '1')
+        self.now += 10
+        new = self.auth.authenticate('user1', '1')
+        
+        self.assertNotEqual(old, new)
+        self.assertIsNone(self.auth.validate_token(old))
+        self.assertEqual(self.auth.validate_token(new), 'user1')
+        self.assertEqual(self.auth.get_active_session_count(), 1)
+        
+        # The new session gets its own, later deadline
+        self.now += SESSION_TTL_SECONDS - 5
+        self.assertEqual(self.auth.validate_token(new), 'user1')
+    
+    def test_stale_heap_entries_skipped(self):
+        replaced = self.auth.authenticate('user1', '1')
+        logged_out = self.auth.authenticate('user2', '2')
+        self.assertTrue(self.auth.logout(logged_out))
+        self.now += 10
+        live = self.auth.authenticate('user1', '1')  # replaces `replaced`
+        other = self.auth.authenticate('user3', '3')
+        
+        # Heap still holds entries for the replaced and logged-out sessions
+        self.assertEqual(len(self.auth._expiry_heap), 4)
+        
+        # Their deadlines pass first: popped without touching live sessions
+        self.now += SESSION_TTL_SECONDS - 5
+        self.assertEqual(self.auth.get_active_session_count(), 2)
+        self.assertEqual(len(self.auth._expiry_heap), 2)
+        self.assertEqual(self.auth.validate_token(live), 'user1')
+        self.assertEqual(self.auth.validate_token(other), 'user3')
+        self.assertIsNone(self.auth.validate_token(replaced))
+        
+        # user1 can still log in again after its stale entry was popped
+        self.assertIsNotNone(self.auth.authenticate('user1', '1'))
+        self.assertIsNone(self.auth.validate_token(live))
+    
+    def test_logout(self):
+        token = self.auth.authenticate('user1', '1')
+        self.assertTrue(self.auth.logout(token))
+        self.assertFalse(self.auth.logout(token))
+        self.assertIsNone(self.auth.validate_token(token))
+
+
+if __name__ == '__main__':
+    unittest.main()
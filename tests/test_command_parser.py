@@ -0,0 +1,118 @@
+"""
+CommandParser tests - run from the repository root with: python -m unittest
+"""
+
+import unittest
+
+from client.command_parser import CommandParser
+
+
+class LoginParseTest(unittest.TestCase):
+    """login takes the whole line, so passwords may contain ';'."""
+    
+    def test_password_with_semicolon_is_not_chained(self):
+        cmd = CommandParser.parse("login user1 pa;ss")
+        self.assertEqual(cmd.name, "login")
+        self.assertEqual(cmd.args, ["user1", "pa;ss"])
+    
+    def test_password_with_spaces(self):
+        cmd = CommandParser.parse("login user1 my pass")
+        self.assertEqual(cmd.args, ["user1", "my pass"])
+    
+    def test_login_inside_chain_stays_in_batch(self):
+        # Client.py then reports that login can't be chained
+        cmd = CommandParser.parse("show_list; login user1 1")
+        self.assertEqual(cmd.name, "batch")
+        self.assertEqual([sub.name for sub in cmd.args], ["show_list", "login"])
+
+
+class ArityTest(unittest.TestCase):
+    """_ARITY: how many arguments each command is split into."""
+    
+    def test_commands_split_into_arity_pieces(self):
+        self.assertEqual(CommandParser.parse("make_res WED 14").args, ["WED", "14"])
+        self.assertEqual(CommandParser.parse("show_day mon").args, ["mon"])
+        self.assertEqual(CommandParser.parse("cancel_res FRI").args, ["FRI"])
+        self.assertEqual(CommandParser.parse("show_list").args, [])
+    
+    def test_command_name_case_insensitive(self):
+        self.assertEqual(CommandParser.parse("MAKE_RES WED 14").name, "make_res")
+    
+    def test_unknown_command(self):
+        self.assertIsNone(CommandParser.parse("bogus 1 2"))
+        self.assertIsNone(CommandParser.parse(""))
+    
+    def test_too_few_arguments_fail_validation(self):
+        cases = [
+            ("login user1", CommandParser.validate_login),
+            ("show_day", CommandParser.validate_show_day),
+            ("make_res WED", CommandParser.validate_make_res),
+            ("make_res", CommandParser.validate_make_res),
+            ("cancel_res", CommandParser.validate_cancel_res),
+        ]
+        for line, validate in cases:
+            with self.subTest(line=line):
+                self.assertEqual(validate(CommandParser.parse(line)), (False, None))
+    
+    def test_extra_arguments_stay_in_last_one(self):
+        # The last argument keeps the rest of the line, so the
+        # validators see "14 extra" / "MON TUE" and reject them
+        cmd = CommandParser.parse("make_res WED 14 extra")
+        self.assertEqual(cmd.args, ["WED", "14 extra"])
+        self.assertEqual(CommandParser.validate_make_res(cmd), (False, None))
+        
+        cmd = CommandParser.parse("show_day MON TUE")
+        self.assertEqual(cmd.args, ["MON TUE"])
+        self.assertEqual(CommandParser.validate_show_day(cmd), (False, None))
+        
+        cmd = CommandParser.parse("cancel_res MON TUE")
+        self.assertEqual(CommandParser.validate_cancel_res(cmd), (False, None))
+    
+    def test_valid_arguments(self):
+        self.assertEqual(CommandParser.validate_make_res(CommandParser.parse("make_res wed 14")),
+                         (True, ("WED", 14)))
+        self.assertEqual(CommandParser.validate_make_res(CommandParser.parse("make_res WED nine")),
+                         (False, None))
+        self.assertEqual(CommandParser.validate_show_day(CommandParser.parse("show_day sun")),
+                         (True, "SUN"))
+
+
+class ChainParseTest(unittest.TestCase):
+    """';' splitting in parse / parse_batch."""
+    
+    def assertBatch(self, line, names):
+        cmd = CommandParser.parse(line)
+        self.assertIsNotNone(cmd, line)
+        self.assertEqual(cmd.name, "batch")
+        self.assertEqual([sub.name for sub in cmd.args], names)
+    
+    def test_two_commands(self):
+        self.assertBatch("make_res MON 14; show_my_res", ["make_res", "show_my_res"])
+        self.assertEqual(CommandParser.parse("make_res MON 14;show_my_res").args[0].args,
+                         ["MON", "14"])
+    
+    def test_empty_segments_ignored(self):
+        self.assertBatch("show_list;;show_my_res", ["show_list", "show_my_res"])
+        self.assertBatch("show_list; ;show_my_res;", ["show_list", "show_my_res"])
+    
+    def test_single_command_with_trailing_semicolon(self):
+        cmd = CommandParser.parse("make_res MON 14;")
+        self.assertEqual(cmd.name, "make_res")
+        self.assertEqual(cmd.args, ["MON", "14"])
+        self.assertEqual(CommandParser.parse("show_list ;;").name, "show_list")
+    
+    def test_only_separators(self):
+        self.assertIsNone(CommandParser.parse(";"))
+        self.assertIsNone(CommandParser.parse(";;"))
+    
+    def test_invalid_part_rejects_whole_line(self):
+        self.assertIsNone(CommandParser.parse("show_list; bogus"))
+        self.assertIsNone(CommandParser.parse("a;;b"))
+    
+    def test_arity_applies_per_part(self):
+        cmd = CommandParser.parse("make_res MON 14 ; cancel_res TUE")
+        self.assertEqual([sub.args for sub in cmd.args], [["MON", "14"], ["TUE"]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,237 @@
+"""
+ScheduleStore tests - run from the repository root with: python -m unittest
+"""
+
+import contextlib
+import io
+import json
+import os
+import pickle
+import tempfile
+import unittest
+
+from server import schedule_store
+from server.schedule_store import ScheduleStore
+
+
+class ReserveCancelTest(unittest.TestCase):
+    """Single-slot operations and the per-user index."""
+    
+    def setUp(self):
+        self.store = ScheduleStore()
+    
+    def test_reserve_and_cancel(self):
+        self.assertTrue(self.store.reserve_slot('MON', 14, 'user1'))
+        self.assertEqual(self.store.get_slot('MON', 14), 'user1')
+        self.assertFalse(self.store.reserve_slot('MON', 14, 'user2'))
+        
+        self.assertTrue(self.store.cancel_reservation('MON', 14))
+        self.assertTrue(self.store.is_slot_available('MON', 14))
+        self.assertFalse(self.store.cancel_reservation('MON', 14))
+    
+    def test_out_of_range(self):
+        self.assertFalse(self.store.reserve_slot('MON', 8, 'user1'))
+        self.assertFalse(self.store.reserve_slot('MON', 23, 'user1'))
+        self.assertFalse(self.store.reserve_slot('XYZ', 10, 'user1'))
+        self.assertIsNone(self.store.get_slot('XYZ', 10))
+    
+    def test_one_reservation_per_user_per_day(self):
+        self.assertTrue(self.store.reserve_slot('TUE', 10, 'user1'))
+        self.assertFalse(self.store.reserve_slot('TUE', 11, 'user1'))
+        self.assertTrue(self.store.is_slot_available('TUE', 11))
+        self.assertTrue(self.store.reserve_slot('WED', 11, 'user1'))
+        self.assertTrue(self.store.reserve_slot('TUE', 11, 'user2'))
+        
+        reservation = self.store.get_user_reservation_for_day('user1', 'TUE')
+        self.assertEqual(reservation.hour, 10)
+        self.assertEqual(
+            [(r.day, r.hour) for r in self.store.get_user_reservations('user1')],
+            [('TUE', 10), ('WED', 11)])
+        
+        # Cancelling frees the day for another slot
+        self.assertTrue(self.store.cancel_reservation('TUE', 10))
+        self.assertIsNone(self.store.get_user_reservation_for_day('user1', 'TUE'))
+        self.assertTrue(self.store.reserve_slot('TUE', 12, 'user1'))
+    
+    def test_reset(self):
+        self.store.reserve_slot('SUN', 20, 'user1')
+        self.store.reset_schedule()
+        self.assertTrue(self.store.is_slot_available('SUN', 20))
+        self.assertEqual(self.store.get_user_reservations('user1'), [])
+
+
+class BatchTest(unittest.TestCase):
+    """reserve_slots_batch / cancel_slots_batch: one flag per item."""
+    
+    def setUp(self):
+        self.store = ScheduleStore()
+    
+    def test_partial_failure(self):
+        self.store.reserve_slot('MON', 9, 'user2')
+        results = self.store.reserve_slots_batch([
+            ('MON', 10, 'user1'),
+            ('MON', 9, 'user3'),     # Taken
+            ('XYZ', 10, 'user1'),    # Unknown day
+            ('MON', 11, 'user1'),    # user1 already has MON
+            ('TUE', 22, 'user1'),
+        ])
+        self.assertEqual(results, [True, False, False, False, True])
+        
+        # Failed items change nothing; the others are all applied
+        self.assertEqual(self.store.get_slot('MON', 9), 'user2')
+        self.assertIsNone(self.store.get_slot('MON', 11))
+        self.assertEqual(
+            [(r.day, r.hour) for r in self.store.get_user_reservations('user1')],
+            [('MON', 10), ('TUE', 22)])
+        self.assertEqual(self.store.get_user_reservations('user3'), [])
+    
+    def test_cancel_partial_failure(self):
+        self.store.reserve_slots_batch([('MON', 10, 'user1'), ('TUE', 10, 'user2')])
+        results = self.store.cancel_slots_batch([
+            ('MON', 10), ('MON', 10), ('WED', 10), ('XYZ', 10), ('TUE', 10)
+        ])
+        self.assertEqual(results, [True, False, False, False, True])
+        self.assertEqual(self.store.get_user_reservations('user1'), [])
+        self.assertEqual(self.store.get_user_reservations('user2'), [])
+    
+    def test_batch_marks_dirty(self):
+        self.assertFalse(self.store._dirty)
+        self.store.reserve_slots_batch([('MON', 10, 'user1')])
+        self.assertTrue(self.store._dirty)
+
+
+class CopyOnWriteTest(unittest.TestCase):
+    """Readers holding a snapshot never see it change."""
+    
+    def setUp(self):
+        self.store = ScheduleStore()
+        self.store.reserve_slot('MON', 10, 'user1')
+    
+    def test_slot_list_snapshot_unchanged_by_writes(self):
+        slots = self.store._slots
+        before = list(slots)
+        
+        self.store.reserve_slot('TUE', 10, 'user2')
+        self.store.cancel_reservation('MON', 10)
+        
+        self.assertEqual(slots, before)
+        self.assertIsNot(self.store._slots, slots)
+        self.assertEqual(self.store.get_slot('TUE', 10), 'user2')
+    
+    def test_user_index_snapshot_unchanged_by_writes(self):
+        user_days = self.store._by_user['user1']
+        
+        self.store.reserve_slot('WED', 12, 'user1')
+        self.store.cancel_reservation('MON', 10)
+        
+        self.assertEqual(user_days, {'MON': 10})
+        self.assertEqual(self.store._by_user['user1'], {'WED': 12})
+    
+    def test_weekly_schedule_from_one_snapshot(self):
+        schedule = self.store.get_weekly_schedule()
+        self.store.reserve_slot('SUN', 22, 'user2')
+        
+        self.assertEqual(schedule['MON'][1]['reserved_by'], 'user1')
+        self.assertTrue(schedule['SUN'][-1]['available'])
+        self.assertFalse(self.store.get_weekly_schedule()['SUN'][-1]['available'])
+    
+    def test_shared_empty_default_never_modified(self):
+        self.store.reserve_slot('MON', 11, 'user9')
+        self.store.cancel_reservation('MON', 11)
+        self.store.cancel_reservation('MON', 11)
+        self.assertEqual(schedule_store._NO_DAYS, {})
+
+
+class PersistenceTest(unittest.TestCase):
+    """flush() / load round trips, skipped writes and failing saves."""
+    
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmpdir.cleanup)
+    
+    def path(self, name):
+        return os.path.join(self._tmpdir.name, name)
+    
+    def round_trip(self, file_format, name):
+        path = self.path(name)
+        store = ScheduleStore(path, file_format=file_format)
+        store.reserve_slots_batch([
+            ('MON', 9, 'user1'), ('WED', 14, 'user2'), ('SUN', 22, 'user1')
+        ])
+        store.flush()
+        self.assertFalse(os.path.exists(path + ".tmp"))
+        
+        loaded = ScheduleStore(path, file_format=file_format)
+        self.assertEqual(loaded._slots, store._slots)
+        self.assertEqual(loaded._by_user, store._by_user)
+        self.assertFalse(loaded._dirty)
+        return path
+    
+    def test_json_round_trip(self):
+        path = self.round_trip("json", "schedule.json")
+        with open(path) as f:
+            self.assertEqual(json.load(f)['WED']['14'], 'user2')
+    
+    def test_pickle_round_trip(self):
+        path = self.round_trip("pickle", "schedule.pickle")
+        with open(path, 'rb') as f:
+            self.assertEqual(pickle.load(f)['WED'][14], 'user2')
+    
+    def test_unknown_format_rejected(self):
+        with self.assertRaises(ValueError):
+            ScheduleStore(self.path("schedule.xml"), file_format="xml")
+    
+    def test_unchanged_payload_not_rewritten(self):
+        path = self.path("schedule.json")
+        store = ScheduleStore(path)
+        store.reserve_slot('MON', 10, 'user1')
+        store.flush()
+        inode = os.stat(path).st_ino
+        
+        # Changes that cancel out: dirty again, but same content
+        store.reserve_slot('TUE', 10, 'user1')
+        store.cancel_reservation('TUE', 10)
+        self.assertTrue(store._dirty)
+        store.flush()
+        self.assertFalse(store._dirty)
+        self.assertEqual(os.stat(path).st_ino, inode)  # os.replace() never ran
+        
+        store.reserve_slot('TUE', 10, 'user1')
+        store.flush()
+        self.assertNotEqual(os.stat(path).st_ino, inode)
+    
+    def test_failing_save_warns_once_and_retries(self):
+        missing_dir = self.path("missing")
+        store = ScheduleStore(os.path.join(missing_dir, "schedule.json"))
+        store.reserve_slot('MON', 10, 'user1')
+        
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            store.flush()
+            store.flush()
+            store.flush()
+        self.assertEqual(out.getvalue().count("Could not save"), 1)
+        self.assertTrue(store._dirty)  # Still pending
+        
+        os.mkdir(missing_dir)
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            store.flush()
+        self.assertIn("saved again", out.getvalue())
+        self.assertFalse(store._dirty)
+        
+        loaded = ScheduleStore(os.path.join(missing_dir, "schedule.json"))
+        self.assertEqual(loaded.get_slot('MON', 10), 'user1')
+    
+    def test_load_skips_unknown_days_and_hours(self):
+        path = self.path("schedule.json")
+        with open(path, 'w') as f:
+            json.dump({"MON": {"9": "user1", "8": "user2", "x": "user3"},
+                       "XYZ": {"10": "user4"}}, f)
+        store = ScheduleStore(path)
+        self.assertEqual(store.get_slot('MON', 9), 'user1')
+        self.assertEqual(sum(slot is not None for slot in store._slots), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
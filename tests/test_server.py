@@ -0,0 +1,322 @@
+"""
+Server tests - run from the repository root with: python -m unittest
+
+Teaching Point: The server runs in a background thread on a free port,
+and the tests talk to it over real TCP sockets.
+"""
+
+import io
+import os
+import socket
+import tempfile
+import threading
+import time
+import unittest
+
+from Server import TennisCourtServer
+from client.http_client import HTTPClient
+from server import http_handler
+from server.http_handler import HTTPHandler, RequestTooLarge
+
+
+def _free_port() -> int:
+    """Ask the OS for a port nobody is listening on."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+class ServerTestCase(unittest.TestCase):
+    """Runs a fresh TennisCourtServer for each test."""
+    
+    def setUp(self):
+        # The server keeps court_schedule.json in the working directory
+        self._cwd = os.getcwd()
+        self._tmpdir = tempfile.TemporaryDirectory()
+        os.chdir(self._tmpdir.name)
+        
+        self.port = _free_port()
+        self.server = TennisCourtServer('127.0.0.1', self.port)
+        self._thread = threading.Thread(target=self.server.start, daemon=True)
+        self._thread.start()
+        self._wait_for_server()
+    
+    def tearDown(self):
+        # Wakes the blocking accept(); start() then calls stop() itself
+        self.server.socket.shutdown(socket.SHUT_RDWR)
+        self._thread.join(timeout=5)
+        os.chdir(self._cwd)
+        self._tmpdir.cleanup()
+    
+    def _wait_for_server(self):
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            try:
+                socket.create_connection(('127.0.0.1', self.port), timeout=1).close()
+                return
+            except OSError:
+                time.sleep(0.05)
+        self.fail("server did not start")
+    
+    def send_raw(self, raw: bytes) -> bytes:
+        """Send raw bytes and return everything the server sends before closing."""
+        with socket.create_connection(('127.0.0.1', self.port), timeout=5) as sock:
+            sock.sendall(raw)
+            chunks = []
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    return b"".join(chunks)
+                chunks.append(chunk)
+
+
+class IdleConnectionTest(ServerTestCase):
+    """Idle keep-alive connections must not lock out other clients."""
+    
+    def setUp(self):
+        super().setUp()
+        self._idle_sockets = []
+    
+    def tearDown(self):
+        for sock in self._idle_sockets:
+            sock.close()
+        super().tearDown()
+    
+    def test_new_client_served_with_all_workers_idle(self):
+        # More idle connections than workers: every worker is now
+        # blocked waiting for a request that never comes
+        for _ in range(TennisCourtServer.MAX_WORKERS + 1):
+            self._idle_sockets.append(
+                socket.create_connection(('127.0.0.1', self.port), timeout=5))
+        time.sleep(0.2)
+        
+        client = HTTPClient('127.0.0.1', self.port)
+        start = time.monotonic()
+        try:
+            success, message, token = client.login('user1', '1')
+        finally:
+            client.close()
+        
+        self.assertTrue(success, message)
+        self.assertIsNotNone(token)
+        # Must not wait for KEEP_ALIVE_TIMEOUT to free a worker
+        self.assertLess(time.monotonic() - start,
+                        TennisCourtServer.KEEP_ALIVE_TIMEOUT / 3)
+    
+    def test_client_mid_request_not_evicted(self):
+        # Oldest connection: headers sent, body still to come
+        body = b'{"username": "user1", "password": "1"}'
+        busy = socket.create_connection(('127.0.0.1', self.port), timeout=5)
+        self._idle_sockets.append(busy)
+        busy.sendall(b"POST /login HTTP/1.1\r\nContent-Length: %d\r\n\r\n" % len(body))
+        time.sleep(0.2)
+        
+        # Enough idle connections behind it to force evictions
+        for _ in range(TennisCourtServer.MAX_WORKERS):
+            self._idle_sockets.append(
+                socket.create_connection(('127.0.0.1', self.port), timeout=5))
+        time.sleep(0.2)
+        
+        busy.sendall(body)
+        response = busy.recv(65536)
+        self.assertTrue(response.startswith(b"HTTP/1.1 200"), response[:80])
+
+
+def _headers_of_size(size: int, blank_line: bool = True) -> bytes:
+    """Request line + one padding header, exactly `size` bytes in total."""
+    head = b"GET /schedule HTTP/1.1\r\n"
+    end = b"\r\n" if blank_line else b""
+    pad = size - len(head) - len(b"X-Pad: \r\n") - len(end)
+    return head + b"X-Pad: " + b"a" * pad + b"\r\n" + end
+
+
+class ReadRequestLimitsTest(unittest.TestCase):
+    """MAX_HEADER_BYTES / MAX_HEADER_LINES / MAX_BODY_BYTES in read_request."""
+    
+    @staticmethod
+    def read(raw: bytes):
+        return HTTPHandler.read_request(io.BufferedReader(io.BytesIO(raw)))
+    
+    def test_headers_at_limit_accepted(self):
+        raw = _headers_of_size(HTTPHandler.MAX_HEADER_BYTES)
+        self.assertEqual(self.read(raw), raw)
+    
+    def test_complete_lines_filling_limit_rejected(self):
+        # Budget used up exactly, but no blank line yet (readline(0) case)
+        raw = _headers_of_size(HTTPHandler.MAX_HEADER_BYTES, blank_line=False)
+        with self.assertRaises(RequestTooLarge):
+            self.read(raw + b"\r\n")
+    
+    def test_headers_over_limit_rejected(self):
+        raw = _headers_of_size(HTTPHandler.MAX_HEADER_BYTES + 1)
+        with self.assertRaises(RequestTooLarge):
+            self.read(raw)
+    
+    def test_header_line_count(self):
+        head = b"GET /schedule HTTP/1.1\r\n"
+        at_limit = head + b"X: a\r\n" * HTTPHandler.MAX_HEADER_LINES + b"\r\n"
+        self.assertEqual(self.read(at_limit), at_limit)
+        
+        over = head + b"X: a\r\n" * (HTTPHandler.MAX_HEADER_LINES + 1) + b"\r\n"
+        with self.assertRaises(RequestTooLarge):
+            self.read(over)
+    
+    def test_body_size(self):
+        size = HTTPHandler.MAX_BODY_BYTES
+        at_limit = f"POST /batch HTTP/1.1\r\nContent-Length: {size}\r\n\r\n".encode() + b"x" * size
+        self.assertEqual(self.read(at_limit), at_limit)
+        
+        # Rejected from the header alone - the body is never read
+        over = f"POST /batch HTTP/1.1\r\nContent-Length: {size + 1}\r\n\r\n".encode()
+        with self.assertRaises(RequestTooLarge):
+            self.read(over)
+    
+    def test_bad_content_length(self):
+        for value in (b"-1", b"abc", b""):
+            with self.subTest(value=value):
+                raw = b"POST /login HTTP/1.1\r\nContent-Length: " + value + b"\r\n\r\n{}"
+                self.assertIsNone(self.read(raw))
+    
+    def test_eof(self):
+        self.assertEqual(self.read(b""), b"")
+        self.assertEqual(self.read(b"GET /schedule HTTP/1.1\r\nHost: x"), b"")
+
+
+class RequestLimitResponseTest(ServerTestCase):
+    """Over-limit requests get a 413 (or 400) and the connection is closed."""
+    
+    def assertRejected(self, raw: bytes, status: bytes):
+        response = self.send_raw(raw)
+        head = response.split(b"\r\n\r\n", 1)[0]
+        self.assertTrue(head.startswith(b"HTTP/1.1 " + status), response[:80])
+        self.assertIn(b"\r\nConnection: close", head)
+    
+    def test_headers_too_large(self):
+        self.assertRejected(_headers_of_size(HTTPHandler.MAX_HEADER_BYTES + 1), b"413")
+    
+    def test_headers_filling_limit(self):
+        raw = _headers_of_size(HTTPHandler.MAX_HEADER_BYTES, blank_line=False)
+        self.assertRejected(raw + b"X: b\r\n\r\n", b"413")
+    
+    def test_too_many_headers(self):
+        raw = (b"GET /schedule HTTP/1.1\r\n" +
+               b"X: a\r\n" * (HTTPHandler.MAX_HEADER_LINES + 1) + b"\r\n")
+        self.assertRejected(raw, b"413")
+    
+    def test_body_too_large_with_body_sent(self):
+        # The unread body must not turn the 413 into a connection reset
+        size = HTTPHandler.MAX_BODY_BYTES * 4
+        raw = f"POST /batch HTTP/1.1\r\nContent-Length: {size}\r\n\r\n".encode()
+        self.assertRejected(raw + b"x" * size, b"413")
+    
+    def test_bad_content_length(self):
+        for value in (b"-5", b"abc"):
+            with self.subTest(value=value):
+                raw = b"POST /login HTTP/1.1\r\nContent-Length: " + value + b"\r\n\r\n"
+                self.assertRejected(raw, b"400")
+
+
+class BatchEndpointTest(ServerTestCase):
+    """POST /batch runs each op like a separate request."""
+    
+    def setUp(self):
+        super().setUp()
+        self.client = HTTPClient('127.0.0.1', self.port)
+        success, message, self.token = self.client.login('user1', '1')
+        self.assertTrue(success, message)
+    
+    def tearDown(self):
+        self.client.close()
+        super().tearDown()
+    
+    def batch(self, ops, stop_on_error=False):
+        success, message, results = self.client.batch(self.token, ops, stop_on_error)
+        self.assertTrue(success, message)
+        return [result["status"] for result in results], results
+    
+    @staticmethod
+    def make_res(day, hour):
+        return {"method": "POST", "path": "/reservations", "body": {"day": day, "hour": hour}}
+    
+    def test_mixed_success_and_failure(self):
+        statuses, results = self.batch([
+            self.make_res("MON", 14),
+            self.make_res("MON", 15),      # Second slot on the same day
+            self.make_res("TUE", 99),      # Invalid hour
+            {"method": "GET", "path": "/reservations"},
+            {"method": "GET", "path": "/nowhere"},
+        ])
+        self.assertEqual(statuses[0], 200)
+        self.assertEqual(statuses[1] // 100, 4)
+        self.assertEqual(statuses[2], 400)
+        self.assertEqual(statuses[3], 200)
+        self.assertEqual(statuses[4], 404)
+        self.assertEqual(len(results[3]["body"]["data"]["reservations"]), 1)
+    
+    def test_stop_on_error(self):
+        statuses, _ = self.batch([
+            self.make_res("WED", 10),
+            self.make_res("WED", 11),      # Fails: one per day
+            self.make_res("THU", 10),      # Never runs
+        ], stop_on_error=True)
+        self.assertEqual(len(statuses), 2)
+        self.assertEqual(statuses[0], 200)
+        
+        success, _, reservations = self.client.get_my_reservations(self.token)
+        self.assertTrue(success)
+        self.assertEqual(len(reservations), 1)
+    
+    def test_nested_batch_login_and_reset_rejected(self):
+        statuses, results = self.batch([
+            {"method": "POST", "path": "/batch", "body": {"ops": []}},
+            {"method": "POST", "path": "/login",
+             "body": {"username": "user2", "password": "2"}},
+            {"method": "POST", "path": "/reset"},
+        ])
+        self.assertEqual(statuses, [400, 400, 400])
+        for result in results:
+            self.assertIn("not allowed in batch", result["body"]["message"])
+    
+    def test_authorization_passed_to_sub_requests(self):
+        self.batch([self.make_res("FRI", 12)])
+        statuses, results = self.batch([{"method": "GET", "path": "/reservations"}])
+        self.assertEqual(statuses, [200])
+        self.assertEqual(results[0]["body"]["data"]["reservations"][0]["username"], "user1")
+    
+    def test_batch_requires_login(self):
+        status, body = self.client.send_request(
+            "POST", "/batch", body={"ops": [{"method": "GET", "path": "/schedule"}]})
+        self.assertEqual(status, 401)
+    
+    def test_malformed_ops(self):
+        statuses, results = self.batch([
+            "GET /schedule",
+            {"method": "GET"},
+            {"method": 1, "path": "/schedule"},
+            {"method": "GET", "path": ["/schedule"]},
+            {"method": "GET", "path": "/reservations HTTP/1.1\r\nX-Injected: 1"},
+            {"method": "GET", "path": "/reservations\r\n\r\n"},
+            {"method": "GET /reservations", "path": "/schedule"},
+            {"method": "", "path": "/schedule"},
+        ])
+        self.assertEqual(statuses, [400] * 8)
+        for result in results:
+            self.assertEqual(result["body"]["message"], "Invalid batch operation")
+    
+    def test_query_string_in_op_path(self):
+        statuses, results = self.batch([{"method": "GET", "path": "/schedule/day?day=MON"}])
+        self.assertEqual(statuses, [200])
+    
+    def test_rejected_ops_return_request_to_pool(self):
+        # Called directly, so the sub-requests use this thread's pool
+        http_handler._request_pool.stack = []
+        request = HTTPHandler.parse_request(
+            b"POST /batch HTTP/1.1\r\n\r\n"
+            b'{"ops": [{"method": "POST", "path": "/login"}]}')
+        self.server.handle_batch(request, "user1")
+        self.assertEqual(len(http_handler._request_pool.stack), 1)
+        http_handler._request_pool.stack = []
+
+
+if __name__ == '__main__':
+    unittest.main()